@@ -7,13 +7,30 @@ from __future__ import annotations
 import configparser
 import hashlib
 import hmac
-import json
 import os
+import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import quote
 
 import httpx
+import orjson
+
+# Shared HTTP client - reused across calls (and warm Lambda invocations)
+# so repeated AWS API requests keep their TLS connection alive
+_http_client = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Lazy-init the shared HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10),
+        )
+    return _http_client
 
 
 def _get_credentials_from_file(profile: str = None) -> tuple[str | None, str | None, str | None]:
@@ -38,30 +55,63 @@ def _get_credentials_from_file(profile: str = None) -> tuple[str | None, str | N
     )
 
 
-def _sign(key: bytes, msg: str) -> bytes:
-    """HMAC-SHA256 sign a message."""
-    return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
+# Constant strings on the signing hot path, pre-encoded once
+_AWS4_REQUEST = b'aws4_request'
+
+
+def _sign(key: bytes, msg: str | bytes) -> bytes:
+    """HMAC-SHA256 sign a message (one-shot C implementation, no HMAC object)."""
+    if isinstance(msg, str):
+        msg = msg.encode('utf-8')
+    return hmac.digest(key, msg, 'sha256')
 
 
+@lru_cache(maxsize=8)
 def _get_signature_key(secret_key: str, date_stamp: str, region: str, service: str) -> bytes:
-    """Derive the signing key for AWS SigV4."""
+    """
+    Derive the signing key for AWS SigV4.
+
+    Cached: the derived key is constant for a given (secret_key, date_stamp,
+    region, service), so repeated signs within a day skip the 4-stage HMAC chain.
+    """
     k_date = _sign(f"AWS4{secret_key}".encode('utf-8'), date_stamp)
     k_region = _sign(k_date, region)
     k_service = _sign(k_region, service)
-    k_signing = _sign(k_service, "aws4_request")
+    k_signing = _sign(k_service, _AWS4_REQUEST)
     return k_signing
 
 
-def _sha256_hash(payload: str) -> str:
-    """SHA256 hash of payload."""
-    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+@lru_cache(maxsize=32)
+def _parse_url(url: str) -> tuple[str, str]:
+    """Split a service URL into (host, canonical_uri).
+
+    Cached - callers sign against a handful of fixed regional endpoints,
+    so the string splitting runs once per endpoint per container.
+    """
+    url_parts = url.replace('https://', '').replace('http://', '').split('/', 1)
+    host = url_parts[0]
+    canonical_uri = '/' + (url_parts[1] if len(url_parts) > 1 else '')
+    return host, canonical_uri
+
+
+# SHA256 of the empty payload - precomputed since GET/DELETE requests hash it often
+_EMPTY_PAYLOAD_HASH = hashlib.sha256(b'').hexdigest()
+
+
+def _sha256_hash(payload: str | bytes | memoryview) -> str:
+    """SHA256 hash of payload (str payloads are encoded, buffers hashed in place)."""
+    if not payload:
+        return _EMPTY_PAYLOAD_HASH
+    if isinstance(payload, str):
+        payload = payload.encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()
 
 
 def sign_request(
     method: str,
     url: str,
     headers: dict,
-    payload: str,
+    payload: str | bytes,
     service: str,
     region: str,
     access_key: str | None = None,
@@ -89,11 +139,9 @@ def sign_request(
     if not access_key or not secret_key:
         raise ValueError("AWS credentials not found (checked env vars and ~/.aws/credentials)")
 
-    # Parse URL to get host and path
+    # Parse URL to get host and path (cached per endpoint)
     # URL format: https://dynamodb.us-east-1.amazonaws.com/
-    url_parts = url.replace('https://', '').replace('http://', '').split('/', 1)
-    host = url_parts[0]
-    canonical_uri = '/' + (url_parts[1] if len(url_parts) > 1 else '')
+    host, canonical_uri = _parse_url(url)
 
     # Create timestamps
     t = datetime.now(timezone.utc)
@@ -112,36 +160,32 @@ def sign_request(
     signed_headers_list = sorted(headers.keys())
     signed_headers = ';'.join(signed_headers_list)
 
-    canonical_headers = ''
-    for key in signed_headers_list:
-        canonical_headers += f"{key}:{headers[key]}\n"
+    canonical_headers = ''.join(f"{key}:{headers[key]}\n" for key in signed_headers_list)
 
     # Hash the payload
     payload_hash = _sha256_hash(payload)
 
-    # Create canonical request
-    canonical_request = '\n'.join([
-        method,
-        canonical_uri,
-        '',  # No query string for DynamoDB
-        canonical_headers,
-        signed_headers,
-        payload_hash
-    ])
+    # Hash the canonical request incrementally instead of assembling the
+    # full string just to hash and discard it
+    h = hashlib.sha256()
+    h.update(method.encode('utf-8'))
+    h.update(b'\n')
+    h.update(canonical_uri.encode('utf-8'))
+    h.update(b'\n\n')  # No query string for DynamoDB
+    h.update(canonical_headers.encode('utf-8'))
+    h.update(b'\n')
+    h.update(signed_headers.encode('utf-8'))
+    h.update(b'\n')
+    h.update(payload_hash.encode('utf-8'))
 
     # Create string to sign
     algorithm = 'AWS4-HMAC-SHA256'
     credential_scope = f"{date_stamp}/{region}/{service}/aws4_request"
-    string_to_sign = '\n'.join([
-        algorithm,
-        amz_date,
-        credential_scope,
-        _sha256_hash(canonical_request)
-    ])
+    string_to_sign = f"{algorithm}\n{amz_date}\n{credential_scope}\n{h.hexdigest()}"
 
     # Calculate signature
     signing_key = _get_signature_key(secret_key, date_stamp, region, service)
-    signature = hmac.new(signing_key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+    signature = hmac.digest(signing_key, string_to_sign.encode('utf-8'), 'sha256').hex()
 
     # Create authorization header
     authorization = (
@@ -159,15 +203,27 @@ def sign_request(
     return result
 
 
+# Secrets cache - avoids a signed HTTPS round-trip on every warm invocation
+# (secrets rotate rarely; the TTL bounds staleness after a rotation)
+_SECRET_CACHE: dict[str, tuple[float, dict]] = {}
+_SECRET_CACHE_TTL = 900.0  # seconds
+
+
 def get_secret(secret_arn: str, region: str = None) -> dict:
     """
     Retrieve a secret from AWS Secrets Manager.
-    Returns the parsed JSON secret value.
+    Returns the parsed JSON secret value (cached across warm invocations).
     """
+    cached = _SECRET_CACHE.get(secret_arn)
+    if cached and time.monotonic() - cached[0] < _SECRET_CACHE_TTL:
+        return cached[1]
+
     region = region or os.environ.get('AWS_REGION_NAME', 'us-east-1')
     endpoint = f"https://secretsmanager.{region}.amazonaws.com"
 
-    payload = json.dumps({'SecretId': secret_arn})
+    # orjson returns bytes, which sign_request and httpx take directly -
+    # no str round-trip before hashing or sending
+    payload = orjson.dumps({'SecretId': secret_arn})
 
     headers = {
         'Content-Type': 'application/x-amz-json-1.1',
@@ -183,33 +239,29 @@ def get_secret(secret_arn: str, region: str = None) -> dict:
         region=region,
     )
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.post(
-            endpoint,
-            headers=signed_headers,
-            content=payload,
-        )
+    response = _get_http_client().post(
+        endpoint,
+        headers=signed_headers,
+        content=payload,
+    )
 
     if response.status_code != 200:
-        error = response.json()
+        error = orjson.loads(response.content)
         error_type = error.get('__type', 'Unknown').split('#')[-1]
         message = error.get('message', error.get('Message', 'Unknown error'))
         raise ValueError(f"Secrets Manager error: {error_type}: {message}")
 
-    result = response.json()
+    result = orjson.loads(response.content)
     secret_string = result.get('SecretString')
 
     if secret_string:
-        return json.loads(secret_string)
+        secret = orjson.loads(secret_string)
+        _SECRET_CACHE[secret_arn] = (time.monotonic(), secret)
+        return secret
     else:
         raise ValueError("Secret does not contain a string value")
 
 
-def _sha256_hash_bytes(payload: bytes) -> str:
-    """SHA256 hash of bytes payload."""
-    return hashlib.sha256(payload).hexdigest()
-
-
 def sign_s3_request(
     method: str,
     bucket: str,
@@ -248,7 +300,7 @@ def sign_s3_request(
     date_stamp = t.strftime('%Y%m%d')
 
     # Hash the payload
-    payload_hash = _sha256_hash_bytes(payload)
+    payload_hash = _sha256_hash(payload)
 
     # Build headers
     headers = {
@@ -294,7 +346,7 @@ def sign_s3_request(
 
     # Calculate signature
     signing_key = _get_signature_key(secret_key, date_stamp, region, 's3')
-    signature = hmac.new(signing_key, string_to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+    signature = hmac.digest(signing_key, string_to_sign.encode('utf-8'), 'sha256').hex()
 
     # Create authorization header
     authorization = (
@@ -339,8 +391,7 @@ def put_s3_object(bucket: str, key: str, data: bytes, region: str = None,
         cache_control=cache_control,
     )
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.put(url, headers=headers, content=data)
+    response = _get_http_client().put(url, headers=headers, content=data)
 
     if response.status_code not in (200, 201):
         raise ValueError(f"S3 PUT error: {response.status_code} - {response.text}")
@@ -4,12 +4,14 @@ Cache warmer Lambda - fetches trending data from TMDB and writes to S3.
 Triggered by EventBridge daily.
 CloudFront serves the S3 files directly, avoiding Lambda invocations.
 """
+import asyncio
 import json
 import os
 
 import httpx
+import orjson
 
-from aws_sigv4 import get_secret, put_s3_object
+from aws_sigv4 import get_secret, sign_s3_request
 
 # Supported locales - must match frontend/src/lib/i18n.js supportedLocales
 SUPPORTED_LOCALES = ['en', 'es', 'fr', 'de']
@@ -28,15 +30,22 @@ def get_tmdb_api_key():
     return api_key
 
 
-def fetch_trending(api_key: str, media_type: str, locale: str = 'en') -> dict:
+async def fetch_trending(client: httpx.AsyncClient, api_key: str, media_type: str, locale: str = 'en') -> dict:
     """Fetch trending data from TMDB API."""
     url = f"https://api.themoviedb.org/3/trending/{media_type}/week"
     params = {"api_key": api_key, "language": locale}
 
-    with httpx.Client(timeout=30.0) as client:
-        response = client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    response = await client.get(url, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+# (title field, date field) per media type - looked up once per item
+# instead of re-branching inside the loop body
+_MEDIA_FIELDS = {
+    'tv': ('name', 'first_air_date'),
+    'movie': ('title', 'release_date'),
+}
 
 
 def normalize_item(item: dict, default_media_type: str) -> dict:
@@ -45,19 +54,14 @@ def normalize_item(item: dict, default_media_type: str) -> dict:
     Keeps only fields the frontend actually uses.
     """
     media_type = item.get('media_type', default_media_type)
+    title_field, date_field = _MEDIA_FIELDS.get(media_type, _MEDIA_FIELDS['movie'])
 
-    if media_type == 'tv':
-        title = item.get('name')
-        date_str = item.get('first_air_date', '')
-    else:
-        title = item.get('title')
-        date_str = item.get('release_date', '')
-
+    date_str = item.get(date_field, '')
     year = int(date_str[:4]) if date_str and len(date_str) >= 4 else None
 
     return {
         'id': item.get('id'),
-        'title': title,
+        'title': item.get(title_field),
         'year': year,
         'overview': item.get('overview'),
         'poster_path': item.get('poster_path'),
@@ -66,6 +70,102 @@ def normalize_item(item: dict, default_media_type: str) -> dict:
     }
 
 
+async def put_s3_object_async(client: httpx.AsyncClient, bucket: str, key: str, data: bytes,
+                              region: str, content_type: str = 'application/json',
+                              cache_control: str = None):
+    """Upload an object to S3 over the shared async client."""
+    url, headers = sign_s3_request(
+        method='PUT',
+        bucket=bucket,
+        key=key,
+        payload=data,
+        region=region,
+        content_type=content_type,
+        cache_control=cache_control,
+    )
+
+    response = await client.put(url, headers=headers, content=data)
+
+    if response.status_code not in (200, 201):
+        raise ValueError(f"S3 PUT error: {response.status_code} - {response.text}")
+
+
+async def _process(client: httpx.AsyncClient, api_key: str, bucket: str, region: str,
+                   media_type: str, locale: str, results: dict):
+    """Fetch one media_type/locale pair from TMDB and write it to S3."""
+    result_key = f"{media_type}-{locale}"
+    print(f"CACHE_WARMER: Fetching {media_type}/{locale} from TMDB...")
+
+    try:
+        data = await fetch_trending(client, api_key, media_type, locale)
+
+        # Normalize items to frontend format, keeping only needed fields
+        default_type = 'movie' if media_type == 'movie' else 'tv' if media_type == 'tv' else None
+        normalized = [normalize_item(item, default_type) for item in data.get('results', [])]
+
+        # Write to S3
+        key = f"trending-{media_type}-{locale}.json"
+        json_data = orjson.dumps({'results': normalized})
+
+        await put_s3_object_async(
+            client,
+            bucket=bucket,
+            key=key,
+            data=json_data,
+            region=region,
+            content_type='application/json',
+            cache_control='public, max-age=3600',
+        )
+
+        results[result_key] = {
+            'status': 'success',
+            'items': len(normalized),
+            'bytes': len(json_data)
+        }
+        print(f"CACHE_WARMER: {media_type}/{locale} - {len(normalized)} items, {len(json_data)} bytes")
+
+    except httpx.HTTPStatusError as e:
+        print(f"CACHE_WARMER: {media_type}/{locale} - TMDB error: {e.response.status_code}")
+        results[result_key] = {
+            'status': 'error',
+            'error': f"TMDB HTTP {e.response.status_code}"
+        }
+    except Exception as e:
+        print(f"CACHE_WARMER: {media_type}/{locale} - Error: {e}")
+        results[result_key] = {
+            'status': 'error',
+            'error': str(e)
+        }
+
+
+# Cap on in-flight fetch+put pairs - covers today's 12 and keeps a
+# stampede in check if more locales are added
+_MAX_CONCURRENT_PAIRS = 12
+
+
+async def _warm_all(api_key: str, bucket: str, region: str) -> dict:
+    """Run all fetch+put pairs concurrently over one connection pool."""
+    results = {}
+    media_types = ['all', 'movie', 'tv']
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_PAIRS)
+
+    async def bounded(media_type: str, locale: str):
+        async with semaphore:
+            await _process(client, api_key, bucket, region, media_type, locale, results)
+
+    async with httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=20),
+    ) as client:
+        await asyncio.gather(*[
+            bounded(media_type, locale)
+            for locale in SUPPORTED_LOCALES
+            for media_type in media_types
+        ])
+
+    return results
+
+
 def handler(event, context):
     """
     Fetch trending data from TMDB and write to S3.
@@ -74,6 +174,9 @@ def handler(event, context):
     - trending-all-en.json, trending-all-es.json, etc.
     - trending-movie-en.json, trending-movie-es.json, etc.
     - trending-tv-en.json, trending-tv-es.json, etc.
+
+    All media_type/locale pairs run concurrently - the handler is
+    network-bound, so wall time is roughly one round-trip, not twelve.
     """
     bucket = os.environ.get('TRENDING_S3_BUCKET')
     if not bucket:
@@ -88,53 +191,7 @@ def handler(event, context):
         print(f"ERROR: Failed to get TMDB API key: {e}")
         return {"statusCode": 500, "body": str(e)}
 
-    results = {}
-    media_types = ['all', 'movie', 'tv']
-
-    for locale in SUPPORTED_LOCALES:
-        for media_type in media_types:
-            result_key = f"{media_type}-{locale}"
-            print(f"CACHE_WARMER: Fetching {media_type}/{locale} from TMDB...")
-
-            try:
-                data = fetch_trending(api_key, media_type, locale)
-
-                # Normalize items to frontend format, keeping only needed fields
-                default_type = 'movie' if media_type == 'movie' else 'tv' if media_type == 'tv' else None
-                normalized = [normalize_item(item, default_type) for item in data.get('results', [])]
-
-                # Write to S3
-                key = f"trending-{media_type}-{locale}.json"
-                json_data = json.dumps({'results': normalized}, separators=(',', ':')).encode('utf-8')
-
-                put_s3_object(
-                    bucket=bucket,
-                    key=key,
-                    data=json_data,
-                    region=region,
-                    content_type='application/json',
-                    cache_control='public, max-age=3600',
-                )
-
-                results[result_key] = {
-                    'status': 'success',
-                    'items': len(normalized),
-                    'bytes': len(json_data)
-                }
-                print(f"CACHE_WARMER: {media_type}/{locale} - {len(normalized)} items, {len(json_data)} bytes")
-
-            except httpx.HTTPStatusError as e:
-                print(f"CACHE_WARMER: {media_type}/{locale} - TMDB error: {e.response.status_code}")
-                results[result_key] = {
-                    'status': 'error',
-                    'error': f"TMDB HTTP {e.response.status_code}"
-                }
-            except Exception as e:
-                print(f"CACHE_WARMER: {media_type}/{locale} - Error: {e}")
-                results[result_key] = {
-                    'status': 'error',
-                    'error': str(e)
-                }
+    results = asyncio.run(_warm_all(api_key, bucket, region))
 
     # Check if all succeeded
     all_success = all(r.get('status') == 'success' for r in results.values())
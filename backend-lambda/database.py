@@ -3,17 +3,31 @@ Database operations using lightweight DynamoDB client (no boto3).
 """
 from __future__ import annotations
 
+import logging
 import os
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 from dynamodb_lite import DynamoDBClient, ConditionalCheckFailedException
 
-print("DEBUG: database.py loading (boto3-free)...", flush=True)
+logger = logging.getLogger(__name__)
 
 # Get table name from environment
 TABLE_NAME = os.environ.get('DYNAMODB_TABLE', 'stellarr-requests')
 AWS_REGION = os.environ.get('AWS_REGION_NAME', 'us-east-1')
 
+# Partitions that hold request items (rate limit / library / cache
+# entries live under synthetic media_type values and are excluded)
+KNOWN_MEDIA_TYPES = ('movie', 'tv')
+
+# Opt-in for the record_type GSI read path. Rows written before the index
+# existed don't carry record_type, so the index is sparse until
+# scripts/backfill-record-type.py has run - flip this on only after the
+# backfill is confirmed, or old requests silently drop from listings.
+USE_RECORD_TYPE_INDEX = os.environ.get('USE_RECORD_TYPE_INDEX', 'false').lower() == 'true'
+
+
 # Create lightweight DynamoDB client
 _client = None
 
@@ -23,13 +37,32 @@ def _get_client() -> DynamoDBClient:
     global _client
     if _client is None:
         _client = DynamoDBClient(TABLE_NAME, AWS_REGION)
-        print(f"DEBUG: DynamoDB client initialized for {TABLE_NAME}", flush=True)
+        logger.debug("DynamoDB client initialized for %s", TABLE_NAME)
     return _client
 
 
+# Formatted timestamp cached per second - write bursts (bulk ingest,
+# webhook storms) reuse the string instead of re-running strftime
+_last_iso: tuple[int, str] = (0, '')
+
+
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string (second precision).
+
+    time.strftime over time.gmtime skips datetime object construction,
+    which matters on write-heavy paths. Sorts consistently with the
+    datetime.isoformat() values written by earlier versions.
+    """
+    global _last_iso
+    now = int(time.time())
+    if now != _last_iso[0]:
+        _last_iso = (now, time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(now)))
+    return _last_iso[1]
+
+
 def init_db():
     """Initialize database - no-op for DynamoDB (table created by Terraform)."""
-    print(f"DEBUG: DynamoDB init - table {TABLE_NAME} ready", flush=True)
+    logger.debug("DynamoDB init - table %s ready", TABLE_NAME)
 
 
 def add_request(
@@ -49,7 +82,8 @@ def add_request(
             'media_type': media_type,
             'tmdb_id': tmdb_id,
             'title': title,
-            'created_at': datetime.now(timezone.utc).isoformat(),
+            'created_at': _utcnow_iso(),
+            'record_type': 'request',  # GSI partition key - see dynamodb.tf
         }
 
         # Add optional fields if present
@@ -71,15 +105,58 @@ def add_request(
             item,
             condition_expression='attribute_not_exists(media_type) AND attribute_not_exists(tmdb_id)'
         )
+        _REQUESTED_CACHE[(media_type, tmdb_id)] = (time.monotonic(), True)
+        _invalidate_request_list()
         return True
     except ConditionalCheckFailedException:
         # Item already exists
         return False
     except Exception as e:
-        print(f"Error adding request: {e}", flush=True)
+        logger.error("Error adding request: %s", e)
         return False
 
 
+def add_requests_bulk(requests: list[dict]) -> int:
+    """
+    Add multiple media requests in one BatchWriteItem pass (25 per trip).
+
+    BatchWriteItem does not support condition expressions, so unlike
+    add_request this overwrites existing items - fine for bulk ingest
+    (queue drains, migrations) where the source is authoritative.
+    Returns the number of items written.
+    """
+    if not requests:
+        return 0
+
+    created_at = _utcnow_iso()
+    items = []
+    for req in requests:
+        item = {
+            'media_type': req['media_type'],
+            'tmdb_id': req['tmdb_id'],
+            'title': req['title'],
+            'created_at': created_at,
+            'record_type': 'request',
+        }
+
+        # Add optional fields if present
+        for field in ('year', 'overview', 'poster_path', 'imdb_id', 'tvdb_id', 'requested_by'):
+            value = req.get(field)
+            if value is not None and value != '':
+                item[field] = value
+
+        items.append(item)
+
+    try:
+        count = _get_client().batch_put(items)
+        if count:
+            _invalidate_request_list()
+        return count
+    except Exception as e:
+        logger.error("Error bulk adding requests: %s", e)
+        return 0
+
+
 def remove_request(tmdb_id: int, media_type: str) -> bool:
     """Remove a media request from DynamoDB."""
     try:
@@ -87,51 +164,140 @@ def remove_request(tmdb_id: int, media_type: str) -> bool:
             'media_type': media_type,
             'tmdb_id': tmdb_id
         })
+        _REQUESTED_CACHE.pop((media_type, tmdb_id), None)
+        _invalidate_request_list()
         return True
     except Exception as e:
-        print(f"Error removing request: {e}", flush=True)
+        logger.error("Error removing request: %s", e)
         return False
 
 
+# Request-list cache - /api/requests and the list exports re-read an
+# unchanged list far more often than it mutates. Write paths clear it;
+# the TTL only bounds staleness if a writer slips through.
+_REQUEST_LIST_CACHE: dict[str | None, tuple[float, list[dict]]] = {}
+_REQUEST_LIST_TTL = 30.0  # seconds
+
+
+def _invalidate_request_list() -> None:
+    """Drop cached request lists after any request mutation."""
+    _REQUEST_LIST_CACHE.clear()
+
+
 def get_all_requests(media_type: str | None = None) -> list[dict]:
     """Get all media requests, optionally filtered by type."""
+    cached = _REQUEST_LIST_CACHE.get(media_type)
+    if cached and time.monotonic() - cached[0] < _REQUEST_LIST_TTL:
+        return list(cached[1])
+
     try:
         client = _get_client()
 
         if media_type:
-            # Query by partition key
+            # Query by partition key (comes back in tmdb_id order)
             items = client.query(
                 key_condition_expression='media_type = :mt',
                 expression_attribute_values={':mt': media_type}
             )
+            # Sort by created_at descending - itemgetter runs the key
+            # extraction in C (every request writer sets created_at)
+            items.sort(key=itemgetter('created_at'), reverse=True)
+        elif USE_RECORD_TYPE_INDEX:
+            # Query the record_type GSI - rate limit and library entries
+            # never carry record_type, and the index sort key already
+            # returns newest first, so no scan and no Python sort
+            items = client.query(
+                key_condition_expression='record_type = :rt',
+                expression_attribute_values={':rt': 'request'},
+                index_name='record_type-created_at-index',
+                scan_index_forward=False
+            )
         else:
-            # Scan entire table (filter out non-request entries)
-            all_items = client.scan()
-            # Filter out rate limit and library entries - only keep 'movie' and 'tv'
-            items = [item for item in all_items if item.get('media_type') in ('movie', 'tv')]
+            # Default path: query the known request partitions in parallel.
+            # Correct regardless of index state - see USE_RECORD_TYPE_INDEX.
+            def query_partition(mt: str) -> list[dict]:
+                return client.query(
+                    key_condition_expression='media_type = :mt',
+                    expression_attribute_values={':mt': mt}
+                )
 
-        # Sort by created_at descending
-        items.sort(key=lambda x: x.get('created_at', ''), reverse=True)
+            with ThreadPoolExecutor(max_workers=len(KNOWN_MEDIA_TYPES)) as pool:
+                partitions = pool.map(query_partition, KNOWN_MEDIA_TYPES)
 
-        return items
+            items = [item for partition in partitions for item in partition]
+            items.sort(key=itemgetter('created_at'), reverse=True)
+
+        _REQUEST_LIST_CACHE[media_type] = (time.monotonic(), items)
+        return list(items)
     except Exception as e:
-        print(f"Error getting requests: {e}", flush=True)
+        logger.error("Error getting requests: %s", e)
         return []
 
 
+# Request-existence cache - browse pages probe the same keys repeatedly
+# within seconds on a warm container, so a short TTL saves a GetItem per
+# probe. Writes update the cache directly (see add_request/remove_request).
+_REQUESTED_CACHE: dict[tuple[str, int], tuple[float, bool]] = {}
+_REQUESTED_CACHE_TTL = 30.0  # seconds
+_REQUESTED_CACHE_MAX = 4096
+
+
 def is_requested(tmdb_id: int, media_type: str) -> bool:
     """Check if a media item has already been requested."""
+    cache_key = (media_type, tmdb_id)
+    cached = _REQUESTED_CACHE.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _REQUESTED_CACHE_TTL:
+        return cached[1]
+
     try:
         item = _get_client().get_item({
             'media_type': media_type,
             'tmdb_id': tmdb_id
         })
-        return item is not None
+        result = item is not None
+
+        if len(_REQUESTED_CACHE) >= _REQUESTED_CACHE_MAX:
+            _REQUESTED_CACHE.clear()
+        _REQUESTED_CACHE[cache_key] = (time.monotonic(), result)
+
+        return result
     except Exception as e:
-        print(f"Error checking request: {e}", flush=True)
+        logger.error("Error checking request: %s", e)
         return False
 
 
+def is_requested_bulk(pairs: list[tuple[int, str]]) -> set[tuple[int, str]]:
+    """
+    Check which (tmdb_id, media_type) pairs have existing requests.
+
+    One BatchGetItem per 100 keys instead of a GetItem per pair.
+    Returns the set of pairs that exist; on error returns an empty set
+    (same fail-open shape as is_requested returning False).
+    """
+    if not pairs:
+        return set()
+
+    try:
+        # BatchGetItem rejects duplicate keys
+        unique_pairs = list(dict.fromkeys(pairs))
+        items = _get_client().batch_get_item([
+            {'media_type': media_type, 'tmdb_id': tmdb_id}
+            for tmdb_id, media_type in unique_pairs
+        ])
+        found = {(item['tmdb_id'], item['media_type']) for item in items}
+
+        # Seed the single-key cache so follow-up probes hit locally
+        now = time.monotonic()
+        if len(_REQUESTED_CACHE) < _REQUESTED_CACHE_MAX:
+            for tmdb_id, media_type in unique_pairs:
+                _REQUESTED_CACHE[(media_type, tmdb_id)] = (now, (tmdb_id, media_type) in found)
+
+        return found
+    except Exception as e:
+        logger.error("Error bulk checking requests: %s", e)
+        return set()
+
+
 def mark_as_added(tmdb_id: int, media_type: str) -> dict | None:
     """
     Mark a request as added to Plex library.
@@ -143,19 +309,23 @@ def mark_as_added(tmdb_id: int, media_type: str) -> dict | None:
                 'media_type': media_type,
                 'tmdb_id': tmdb_id
             },
-            update_expression='SET added_at = :now',
+            # Also stamp record_type so pre-GSI rows self-heal into the index
+            update_expression='SET added_at = :now, record_type = :rt',
             condition_expression='attribute_exists(media_type) AND attribute_not_exists(added_at)',
             expression_attribute_values={
-                ':now': datetime.now(timezone.utc).isoformat()
+                ':now': _utcnow_iso(),
+                ':rt': 'request'
             },
             return_values='ALL_NEW'
         )
+        if result:
+            _invalidate_request_list()
         return result if result else None
     except ConditionalCheckFailedException:
         # Either item doesn't exist or already marked as added
         return None
     except Exception as e:
-        print(f"Error marking request as added: {e}", flush=True)
+        logger.error("Error marking request as added: %s", e)
         return None
 
 
@@ -173,21 +343,23 @@ def find_by_tvdb_id(tvdb_id: int, media_type: str) -> dict | None:
         )
         return items[0] if items else None
     except Exception as e:
-        print(f"Error finding by tvdb_id: {e}", flush=True)
+        logger.error("Error finding by tvdb_id: %s", e)
         return None
 
 
 def find_by_plex_guid(plex_guid: str) -> dict | None:
     """Find a request by Plex GUID."""
     try:
-        # Scan with filter (plex_guid is not a key)
-        all_items = _get_client().scan(
-            filter_expression='plex_guid = :pg',
-            expression_attribute_values={':pg': plex_guid}
+        # Query the sparse GSI - only items with a plex_guid are indexed,
+        # so this stays cheap regardless of table size (no full scan)
+        items = _get_client().query(
+            key_condition_expression='plex_guid = :pg',
+            expression_attribute_values={':pg': plex_guid},
+            index_name='plex_guid-index'
         )
-        return all_items[0] if all_items else None
+        return items[0] if items else None
     except Exception as e:
-        print(f"Error finding by plex_guid: {e}", flush=True)
+        logger.error("Error finding by plex_guid: %s", e)
         return None
 
 
@@ -199,14 +371,15 @@ def update_plex_guid(tmdb_id: int, media_type: str, plex_guid: str) -> bool:
                 'media_type': media_type,
                 'tmdb_id': tmdb_id
             },
-            update_expression='SET plex_guid = :pg',
+            update_expression='SET plex_guid = :pg, record_type = :rt',
             expression_attribute_values={
-                ':pg': plex_guid
+                ':pg': plex_guid,
+                ':rt': 'request'
             }
         )
         return True
     except Exception as e:
-        print(f"Error updating plex_guid: {e}", flush=True)
+        logger.error("Error updating plex_guid: %s", e)
         return False
 
 
@@ -226,9 +399,10 @@ def check_rate_limit(ip: str, max_attempts: int, window_seconds: int) -> tuple[b
         if not item:
             return True, max_attempts
 
-        failed_attempts = int(item.get('failed_attempts', 0))
-        first_attempt = int(item.get('first_attempt', 0))
-        current_time = int(datetime.now(timezone.utc).timestamp())
+        # The lite client unmarshals N-typed attributes to int already
+        failed_attempts = item.get('failed_attempts', 0)
+        first_attempt = item.get('first_attempt', 0)
+        current_time = int(time.time())
 
         # Check if window has expired
         if current_time - first_attempt > window_seconds:
@@ -242,7 +416,7 @@ def check_rate_limit(ip: str, max_attempts: int, window_seconds: int) -> tuple[b
         return True, max_attempts - failed_attempts
 
     except Exception as e:
-        print(f"Error checking rate limit: {e}", flush=True)
+        logger.error("Error checking rate limit: %s", e)
         # Fail open - allow request if we can't check
         return True, max_attempts
 
@@ -252,11 +426,13 @@ def record_failed_attempt(ip: str, window_seconds: int) -> int:
     Record a failed auth attempt. Returns new failure count.
     Uses atomic increment to handle concurrent requests.
     """
-    try:
-        current_time = int(datetime.now(timezone.utc).timestamp())
-        ttl = current_time + window_seconds + 60  # Extra minute buffer
+    current_time = int(time.time())
+    ttl = current_time + window_seconds + 60  # Extra minute buffer
 
-        # Try to increment existing counter
+    try:
+        # Increment the counter, but only while the window is still open.
+        # The condition makes window expiry atomic - no read-then-reset race,
+        # and the common in-window path is a single round-trip.
         result = _get_client().update_item(
             key={
                 'media_type': f'RATELIMIT#{ip}',
@@ -266,11 +442,13 @@ def record_failed_attempt(ip: str, window_seconds: int) -> int:
                             'first_attempt = if_not_exists(first_attempt, :now), '
                             'last_attempt = :now, '
                             'ttl = :ttl',
+            condition_expression='attribute_not_exists(first_attempt) OR first_attempt >= :window_start',
             expression_attribute_values={
                 ':zero': 0,
                 ':inc': 1,
                 ':now': current_time,
-                ':ttl': ttl
+                ':ttl': ttl,
+                ':window_start': current_time - window_seconds
             },
             return_values='ALL_NEW'
         )
@@ -278,11 +456,11 @@ def record_failed_attempt(ip: str, window_seconds: int) -> int:
         if not result:
             return 0
 
-        new_count = int(result.get('failed_attempts', 0))
-        first_attempt = int(result.get('first_attempt', 0))
+        return result.get('failed_attempts', 0)
 
-        # If the window has passed, reset the counter
-        if current_time - first_attempt > window_seconds:
+    except ConditionalCheckFailedException:
+        # Window expired - start a fresh one with a single overwrite
+        try:
             _get_client().put_item({
                 'media_type': f'RATELIMIT#{ip}',
                 'tmdb_id': 0,
@@ -292,11 +470,11 @@ def record_failed_attempt(ip: str, window_seconds: int) -> int:
                 'ttl': ttl
             })
             return 1
-
-        return new_count
-
+        except Exception as e:
+            logger.error("Error resetting rate limit window: %s", e)
+            return 0
     except Exception as e:
-        print(f"Error recording failed attempt: {e}", flush=True)
+        logger.error("Error recording failed attempt: %s", e)
         return 0
 
 
@@ -309,7 +487,7 @@ def clear_rate_limit(ip: str) -> bool:
         })
         return True
     except Exception as e:
-        print(f"Error clearing rate limit: {e}", flush=True)
+        logger.error("Error clearing rate limit: %s", e)
         return False
 
 
@@ -338,10 +516,10 @@ def sync_library(items: list[dict], media_type: str, clear_first: bool = False)
                     for item in existing
                 ]
                 deleted = client.batch_delete(keys_to_delete)
-                print(f"SYNC: Cleared {deleted} existing library items", flush=True)
+                logger.info("SYNC: Cleared %d existing library items", deleted)
 
         # Build items for batch insert
-        synced_at = datetime.now(timezone.utc).isoformat()
+        synced_at = _utcnow_iso()
         lib_items = []
         for item in items:
             lib_item = {
@@ -359,7 +537,7 @@ def sync_library(items: list[dict], media_type: str, clear_first: bool = False)
         written = client.batch_put(lib_items)
         return written
     except Exception as e:
-        print(f"Error syncing library: {e}", flush=True)
+        logger.error("Error syncing library: %s", e)
         return 0
 
 
@@ -373,38 +551,68 @@ def is_in_library(tmdb_id: int, media_type: str) -> bool:
         })
         return item is not None
     except Exception as e:
-        print(f"Error checking library: {e}", flush=True)
+        logger.error("Error checking library: %s", e)
         return False
 
 
+def is_in_library_bulk(pairs: list[tuple[int, str]]) -> set[tuple[int, str]]:
+    """
+    Check which (tmdb_id, media_type) pairs exist in the Plex library.
+
+    Mirrors is_requested_bulk: one BatchGetItem against the LIBRARY#
+    partitions instead of a GetItem per pair. Fails open to an empty set.
+    """
+    if not pairs:
+        return set()
+
+    try:
+        unique_pairs = list(dict.fromkeys(pairs))
+        items = _get_client().batch_get_item([
+            {'media_type': f'LIBRARY#{media_type}', 'tmdb_id': tmdb_id}
+            for tmdb_id, media_type in unique_pairs
+        ])
+        # Strip the LIBRARY# prefix back off for the caller
+        return {
+            (item['tmdb_id'], item['media_type'][8:])
+            for item in items
+        }
+    except Exception as e:
+        logger.error("Error bulk checking library: %s", e)
+        return set()
+
+
 def get_library_ids(media_type: str | None = None) -> set[tuple[int, str]]:
     """Get all (tmdb_id, media_type) pairs in library for batch checking."""
     try:
         client = _get_client()
         result = set()
 
+        # Only the sort key is needed - projecting it alone keeps the
+        # response to a few bytes per item instead of the full record
         if media_type:
             library_key = f'LIBRARY#{media_type}'
             items = client.query(
                 key_condition_expression='media_type = :mt',
-                expression_attribute_values={':mt': library_key}
+                expression_attribute_values={':mt': library_key},
+                projection_expression='tmdb_id'
             )
             for item in items:
                 result.add((item['tmdb_id'], media_type))
         else:
-            # Scan for both movie and tv library items
+            # Query both movie and tv library partitions
             for mt in ['movie', 'tv']:
                 library_key = f'LIBRARY#{mt}'
                 items = client.query(
                     key_condition_expression='media_type = :mt',
-                    expression_attribute_values={':mt': library_key}
+                    expression_attribute_values={':mt': library_key},
+                    projection_expression='tmdb_id'
                 )
                 for item in items:
                     result.add((item['tmdb_id'], mt))
 
         return result
     except Exception as e:
-        print(f"Error getting library ids: {e}", flush=True)
+        logger.error("Error getting library ids: %s", e)
         return set()
 
 
@@ -430,7 +638,7 @@ def get_plex_guid_cache(plex_guid: str) -> dict | None:
             }
         return None
     except Exception as e:
-        print(f"Error getting plex_guid cache: {e}", flush=True)
+        logger.error("Error getting plex_guid cache: %s", e)
         return None
 
 
@@ -443,7 +651,7 @@ def set_plex_guid_cache(plex_guid: str, tmdb_id: int | None, tvdb_id: int | None
             'media_type': 'PLEX_GUID_CACHE',
             'tmdb_id': hash(plex_guid) % (2**31),  # Use hash as sort key
             'plex_guid': plex_guid,
-            'cached_at': datetime.now(timezone.utc).isoformat()
+            'cached_at': _utcnow_iso()
         }
         if tmdb_id is not None:
             item['show_tmdb_id'] = tmdb_id
@@ -452,7 +660,7 @@ def set_plex_guid_cache(plex_guid: str, tmdb_id: int | None, tvdb_id: int | None
         _get_client().put_item(item)
         return True
     except Exception as e:
-        print(f"Error setting plex_guid cache: {e}", flush=True)
+        logger.error("Error setting plex_guid cache: %s", e)
         return False
 
 
@@ -469,7 +677,7 @@ def get_trending_key() -> str | None:
             return item.get('trending_key')
         return None
     except Exception as e:
-        print(f"Error getting trending key: {e}", flush=True)
+        logger.error("Error getting trending key: %s", e)
         return None
 
 
@@ -480,11 +688,11 @@ def set_trending_key(key: str) -> bool:
             'media_type': 'CONFIG',
             'tmdb_id': 0,
             'trending_key': key,
-            'created_at': datetime.now(timezone.utc).isoformat()
+            'created_at': _utcnow_iso()
         })
         return True
     except Exception as e:
-        print(f"Error setting trending key: {e}", flush=True)
+        logger.error("Error setting trending key: %s", e)
         return False
 
 
@@ -495,7 +703,7 @@ def get_or_create_trending_key() -> str:
     if not key:
         key = sec.token_urlsafe(32)
         set_trending_key(key)
-        print(f"DEBUG: Generated new trending key", flush=True)
+        logger.debug("Generated new trending key")
     return key
 
 
@@ -552,7 +760,7 @@ def find_by_title(title: str, media_type: str, year: int | None = None) -> dict
 
         return None
     except Exception as e:
-        print(f"Error finding by title: {e}", flush=True)
+        logger.error("Error finding by title: %s", e)
         return None
 
 
@@ -571,13 +779,14 @@ def get_all_library_tmdb_ids() -> dict[str, list[int]]:
             library_key = f'LIBRARY#{media_type}'
             items = client.query(
                 key_condition_expression='media_type = :mt',
-                expression_attribute_values={':mt': library_key}
+                expression_attribute_values={':mt': library_key},
+                projection_expression='tmdb_id'
             )
             result[media_type] = [item['tmdb_id'] for item in items]
 
         return result
     except Exception as e:
-        print(f"Error getting library tmdb ids: {e}", flush=True)
+        logger.error("Error getting library tmdb ids: %s", e)
         return {"movie": [], "tv": []}
 
 
@@ -597,11 +806,11 @@ def save_push_subscription(user_name: str, subscription: dict) -> bool:
             'tmdb_id': 0,  # Dummy sort key
             'endpoint': subscription['endpoint'],
             'keys': subscription['keys'],
-            'subscribed_at': datetime.now(timezone.utc).isoformat()
+            'subscribed_at': _utcnow_iso()
         })
         return True
     except Exception as e:
-        print(f"Error saving push subscription: {e}", flush=True)
+        logger.error("Error saving push subscription: %s", e)
         return False
 
 
@@ -623,7 +832,7 @@ def get_push_subscription(user_name: str) -> dict | None:
             }
         return None
     except Exception as e:
-        print(f"Error getting push subscription: {e}", flush=True)
+        logger.error("Error getting push subscription: %s", e)
         return None
 
 
@@ -637,5 +846,12 @@ def delete_push_subscription(user_name: str) -> bool:
         })
         return True
     except Exception as e:
-        print(f"Error deleting push subscription: {e}", flush=True)
+        logger.error("Error deleting push subscription: %s", e)
         return False
+
+
+# Build the client during the Lambda INIT phase (module import) so the
+# first invocation doesn't pay construction inside billed request time.
+# Local imports (scripts, tests) stay lazy.
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    _get_client()
@@ -31,7 +31,7 @@ docker run --rm --platform linux/arm64 \
     public.ecr.aws/lambda/python:3.12 \
     -c '
         pip install -r /var/task/requirements-layer.txt -t /var/layer --quiet && \
-        python -m compileall -b -q /var/layer && \
+        python -m compileall -b -q -o 2 /var/layer && \
         find /var/layer -type d -name "__pycache__" -exec rm -rf {} + 2>/dev/null || true
     '
 
@@ -52,7 +52,7 @@ docker run --rm --platform linux/arm64 \
     -c '
         pip install -r /var/task/requirements.txt -t /var/package --quiet && \
         cp /var/task/*.py /var/package/ && \
-        python -m compileall -b -q /var/package && \
+        python -m compileall -b -q -o 2 /var/package && \
         python -c "
 import os
 import shutil
@@ -4,11 +4,12 @@ Replaces boto3 for ~70MB smaller Lambda packages.
 """
 from __future__ import annotations
 
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import httpx
+import orjson
 
 from aws_sigv4 import sign_request
 
@@ -26,6 +27,42 @@ class ConditionalCheckFailedException(DynamoDBError):
     pass
 
 
+# One HTTP client shared by every DynamoDBClient instance, so multiple
+# table clients in the same container reuse a single keepalive TLS
+# session to dynamodb.<region>.amazonaws.com. Sized for the Lambda
+# execution model (one request per container): a couple of keepalive
+# slots with a long expiry, and a connect that fails fast instead of
+# eating the whole 30s budget on a stuck SYN.
+_http_client = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Lazy-init the shared HTTP client."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            timeout=httpx.Timeout(connect=3.0, read=10.0, write=5.0, pool=2.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=2,
+                max_connections=10,
+                keepalive_expiry=300,
+            ),
+        )
+    return _http_client
+
+
+# Scalar marshalling fast paths - one type() hash lookup instead of an
+# isinstance chain per attribute. Exact-type dispatch also handles bool
+# correctly for free (isinstance(True, int) is True, type(True) is bool).
+_MARSHAL_SCALAR = {
+    str: lambda v: {'S': v},
+    bool: lambda v: {'BOOL': v},
+    int: lambda v: {'N': str(v)},
+    float: lambda v: {'N': str(v)},
+    type(None): lambda v: {'NULL': True},
+}
+
+
 class DynamoDBClient:
     """Lightweight DynamoDB client."""
 
@@ -33,17 +70,15 @@ class DynamoDBClient:
         self.table_name = table_name
         self.region = region or os.environ.get('AWS_REGION_NAME', 'us-east-1')
         self.endpoint = f"https://dynamodb.{self.region}.amazonaws.com"
-        self._client = None
 
     def _get_client(self) -> httpx.Client:
-        """Lazy-init HTTP client."""
-        if self._client is None:
-            self._client = httpx.Client(timeout=30.0)
-        return self._client
+        """Get the shared HTTP client."""
+        return _get_http_client()
 
     def _request(self, operation: str, payload: dict) -> dict:
         """Make a signed request to DynamoDB."""
-        body = json.dumps(payload)
+        # orjson runs on every DB call - bytes in, bytes out, no str copies
+        body = orjson.dumps(payload)
 
         headers = {
             'Content-Type': 'application/x-amz-json-1.0',
@@ -66,7 +101,7 @@ class DynamoDBClient:
         )
 
         if response.status_code != 200:
-            error = response.json()
+            error = orjson.loads(response.content)
             error_type = error.get('__type', 'Unknown').split('#')[-1]
             message = error.get('message', error.get('Message', 'Unknown error'))
 
@@ -74,58 +109,63 @@ class DynamoDBClient:
                 raise ConditionalCheckFailedException(error_type, message)
             raise DynamoDBError(error_type, message)
 
-        return response.json()
+        return orjson.loads(response.content)
 
     # --- Type Marshalling ---
 
     @staticmethod
     def _to_dynamodb(value: Any) -> dict:
         """Convert Python value to DynamoDB type format."""
-        if value is None:
-            return {'NULL': True}
+        fn = _MARSHAL_SCALAR.get(type(value))
+        if fn is not None:
+            return fn(value)
+        # Containers and subclasses fall through to the general checks
+        if isinstance(value, list):
+            return {'L': [DynamoDBClient._to_dynamodb(v) for v in value]}
+        elif isinstance(value, dict):
+            return {'M': {k: DynamoDBClient._to_dynamodb(v) for k, v in value.items()}}
         elif isinstance(value, bool):
             return {'BOOL': value}
-        elif isinstance(value, str):
-            return {'S': value}
         elif isinstance(value, (int, float)):
             return {'N': str(value)}
-        elif isinstance(value, list):
-            return {'L': [DynamoDBClient._to_dynamodb(v) for v in value]}
-        elif isinstance(value, dict):
-            return {'M': {k: DynamoDBClient._to_dynamodb(v) for k, v in value.items()}}
         else:
             return {'S': str(value)}
 
     @staticmethod
     def _from_dynamodb(item: dict) -> Any:
         """Convert DynamoDB type format to Python value."""
-        if 'S' in item:
-            return item['S']
-        elif 'N' in item:
+        # Wire items are single-key dicts - pull the tag and value in one
+        # pass instead of probing each tag with 'in' + a second lookup
+        tag, value = next(iter(item.items()), ('', None))
+        if tag == 'S':
+            return value
+        elif tag == 'N':
             # Try int first, fall back to float
-            n = item['N']
             try:
-                return int(n)
+                return int(value)
             except ValueError:
-                return float(n)
-        elif 'BOOL' in item:
-            return item['BOOL']
-        elif 'NULL' in item:
+                return float(value)
+        elif tag == 'BOOL':
+            return value
+        elif tag == 'NULL':
             return None
-        elif 'L' in item:
-            return [DynamoDBClient._from_dynamodb(v) for v in item['L']]
-        elif 'M' in item:
-            return {k: DynamoDBClient._from_dynamodb(v) for k, v in item['M'].items()}
+        elif tag == 'L':
+            return [DynamoDBClient._from_dynamodb(v) for v in value]
+        elif tag == 'M':
+            return {k: DynamoDBClient._from_dynamodb(v) for k, v in value.items()}
         else:
             return None
 
     def _marshal_item(self, item: dict) -> dict:
         """Convert Python dict to DynamoDB Item format."""
-        return {k: self._to_dynamodb(v) for k, v in item.items() if v is not None}
+        # Local binding skips the per-attribute self lookup in the loop
+        to_dynamodb = DynamoDBClient._to_dynamodb
+        return {k: to_dynamodb(v) for k, v in item.items() if v is not None}
 
     def _unmarshal_item(self, item: dict) -> dict:
         """Convert DynamoDB Item format to Python dict."""
-        return {k: self._from_dynamodb(v) for k, v in item.items()}
+        from_dynamodb = DynamoDBClient._from_dynamodb
+        return {k: from_dynamodb(v) for k, v in item.items()}
 
     def _marshal_key(self, key: dict) -> dict:
         """Marshal a key for DynamoDB."""
@@ -171,8 +211,11 @@ class DynamoDBClient:
         key_condition_expression: str,
         expression_attribute_values: dict,
         expression_attribute_names: dict = None,
+        index_name: str = None,
+        scan_index_forward: bool = None,
+        projection_expression: str = None,
     ) -> list[dict]:
-        """Query items by partition key."""
+        """Query items by partition key (optionally against a secondary index)."""
         payload = {
             'TableName': self.table_name,
             'KeyConditionExpression': key_condition_expression,
@@ -183,13 +226,42 @@ class DynamoDBClient:
 
         if expression_attribute_names:
             payload['ExpressionAttributeNames'] = expression_attribute_names
+        if index_name:
+            payload['IndexName'] = index_name
+        if scan_index_forward is not None:
+            payload['ScanIndexForward'] = scan_index_forward
+        if projection_expression:
+            payload['ProjectionExpression'] = projection_expression
+
+        # Follow the LastEvaluatedKey chain like _scan_segment does - a
+        # single Query response caps at 1MB, which would silently truncate
+        # large partitions
+        all_items = []
+        while True:
+            response = self._request('Query', payload)
+            items = response.get('Items', [])
+            all_items.extend([self._unmarshal_item(item) for item in items])
 
-        response = self._request('Query', payload)
-        items = response.get('Items', [])
-        return [self._unmarshal_item(item) for item in items]
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            payload['ExclusiveStartKey'] = last_key
+
+        return all_items
 
-    def scan(self, filter_expression: str = None, expression_attribute_values: dict = None) -> list[dict]:
-        """Scan the entire table."""
+    def scan(
+        self,
+        filter_expression: str = None,
+        expression_attribute_values: dict = None,
+        total_segments: int = 1,
+        projection_expression: str = None,
+    ) -> list[dict]:
+        """Scan the entire table.
+
+        With total_segments > 1 the keyspace is split into parallel scan
+        segments fetched concurrently, so wall time is roughly
+        pages / segments round-trips. Scan results are unordered either way.
+        """
         payload = {'TableName': self.table_name}
 
         if filter_expression:
@@ -198,8 +270,26 @@ class DynamoDBClient:
             payload['ExpressionAttributeValues'] = {
                 k: self._to_dynamodb(v) for k, v in expression_attribute_values.items()
             }
-
-        # Handle pagination for large tables
+        if projection_expression:
+            payload['ProjectionExpression'] = projection_expression
+
+        if total_segments <= 1:
+            return self._scan_segment(payload)
+
+        # The shared httpx client is thread-safe, so segment workers
+        # reuse the same connection pool
+        with ThreadPoolExecutor(max_workers=total_segments) as pool:
+            futures = [
+                pool.submit(
+                    self._scan_segment,
+                    {**payload, 'Segment': segment, 'TotalSegments': total_segments},
+                )
+                for segment in range(total_segments)
+            ]
+            return [item for future in futures for item in future.result()]
+
+    def _scan_segment(self, payload: dict) -> list[dict]:
+        """Follow one scan (segment)'s LastEvaluatedKey chain to the end."""
         all_items = []
         while True:
             response = self._request('Scan', payload)
@@ -242,6 +332,31 @@ class DynamoDBClient:
             return self._unmarshal_item(response['Attributes'])
         return None
 
+    def batch_get_item(self, keys: list[dict]) -> list[dict]:
+        """
+        Get multiple items in batches of 100 (BatchGetItem limit).
+        Returns the items that exist; missing keys are simply absent.
+        """
+        if not keys:
+            return []
+
+        all_items = []
+        # DynamoDB BatchGetItem supports max 100 keys per request
+        for i in range(0, len(keys), 100):
+            batch = [self._marshal_key(key) for key in keys[i:i + 100]]
+            request_items = {self.table_name: {'Keys': batch}}
+
+            # Follow UnprocessedKeys until the batch drains (throttling)
+            while request_items.get(self.table_name, {}).get('Keys'):
+                response = self._request('BatchGetItem', {
+                    'RequestItems': request_items
+                })
+                items = response.get('Responses', {}).get(self.table_name, [])
+                all_items.extend(self._unmarshal_item(item) for item in items)
+                request_items = response.get('UnprocessedKeys', {})
+
+        return all_items
+
     def batch_delete(self, keys: list[dict]) -> int:
         """
         Delete multiple items in batches of 25.
@@ -1,19 +1,32 @@
 from fastapi import FastAPI, HTTPException, Depends, Request, Response, Query, Header, Form
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from mangum import Mangum
 import asyncio
 import json
+import orjson
 import secrets
 import hmac
 import hashlib
 import base64
+import threading
 import time
 import logging
 import os
 
-print("DEBUG: Starting main.py module load...", flush=True)
+# Level goes on the root logger so every module logger (database, tmdb,
+# plex, ...) inherits it - a level on just this logger would leave the
+# others at WARNING and drop their SYNC:/WEBHOOK: lines from CloudWatch.
+# The Lambda runtime pre-installs a root handler; basicConfig covers
+# local runs where it hasn't (it no-ops on a configured root).
+_LOG_LEVEL = logging.DEBUG if os.environ.get('DEBUG') else logging.INFO
+logging.basicConfig(level=_LOG_LEVEL)
+logging.getLogger().setLevel(_LOG_LEVEL)
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # Lazy imports for cold start optimization
@@ -30,7 +43,7 @@ def get_settings_lazy():
     """Lazy load settings from Secrets Manager on first use."""
     global _settings
     if _settings is None:
-        print("DEBUG: Lazy loading settings...", flush=True)
+        logger.debug("Lazy loading settings...")
         from config import get_settings
         _settings = get_settings()
     return _settings
@@ -40,7 +53,7 @@ def get_database():
     """Lazy load database module on first use."""
     global _database
     if _database is None:
-        print("DEBUG: Lazy loading database...", flush=True)
+        logger.debug("Lazy loading database...")
         import database
         _database = database
     return _database
@@ -50,7 +63,7 @@ def get_tmdb_client():
     """Lazy load TMDB client on first use."""
     global _tmdb_client
     if _tmdb_client is None:
-        print("DEBUG: Lazy loading TMDB client...", flush=True)
+        logger.debug("Lazy loading TMDB client...")
         from tmdb import tmdb_client
         _tmdb_client = tmdb_client
     return _tmdb_client
@@ -60,7 +73,7 @@ def get_plex_module():
     """Lazy load Plex module on first use."""
     global _plex_module
     if _plex_module is None:
-        print("DEBUG: Lazy loading Plex module...", flush=True)
+        logger.debug("Lazy loading Plex module...")
         import plex
         _plex_module = plex
     return _plex_module
@@ -70,7 +83,7 @@ def get_tvdb_module():
     """Lazy load TVDB module on first use."""
     global _tvdb_module
     if _tvdb_module is None:
-        print("DEBUG: Lazy loading TVDB module...", flush=True)
+        logger.debug("Lazy loading TVDB module...")
         import tvdb
         _tvdb_module = tvdb
     return _tvdb_module
@@ -82,7 +95,7 @@ def get_webpush_module():
     """Lazy load WebPush module on first use."""
     global _webpush_module
     if _webpush_module is None:
-        print("DEBUG: Lazy loading WebPush module...", flush=True)
+        logger.debug("Lazy loading WebPush module...")
         import webpush
         _webpush_module = webpush
     return _webpush_module
@@ -99,94 +112,139 @@ ALLOWED_ORIGIN = os.environ.get('ALLOWED_ORIGIN', '*')
 # Session duration: 30 days in seconds
 SESSION_DURATION_SECONDS = 30 * 24 * 60 * 60
 
+# HMAC context with the session key already mixed in. Building it keys the
+# SHA256 ipad/opad schedule once per instance; per-token signing then just
+# copies the context instead of redoing the key setup.
+_session_hmac_template = None
+
+
+def _get_session_hmac():
+    """Lazy-build the keyed HMAC template (settings come from Secrets Manager)."""
+    global _session_hmac_template
+    if _session_hmac_template is None:
+        settings = get_settings_lazy()
+        _session_hmac_template = hmac.new(
+            settings.app_secret_key.encode(), b"", hashlib.sha256
+        )
+    return _session_hmac_template
+
+
+def _sign_payload(payload: bytes) -> bytes:
+    """HMAC-SHA256 a token payload using the cached key context."""
+    h = _get_session_hmac().copy()
+    h.update(payload)
+    return h.digest()
+
+
+def _b64u(b: bytes) -> bytes:
+    """Unpadded urlsafe base64, staying in bytes."""
+    return base64.urlsafe_b64encode(b).rstrip(b"=")
+
 
 def create_session_token(name: str = "") -> str:
     """Create a signed session token with timestamp and optional name."""
-    settings = get_settings_lazy()
-    timestamp = str(int(time.time()))
+    # Build the token in bytes end-to-end; the only str conversion is the
+    # final decode of the finished token
+    timestamp = b"%d" % int(time.time())
     # Include name in the signed payload
-    name_b64 = base64.urlsafe_b64encode(name.encode()).decode().rstrip("=") if name else ""
-    payload = f"{timestamp}.{name_b64}"
-    signature = hmac.new(
-        settings.app_secret_key.encode(),
-        payload.encode(),
-        hashlib.sha256
-    ).digest()
-    sig_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
-    return f"{payload}.{sig_b64}"
-
-
-def verify_session_token(authorization: str | None = Header(None, alias="Authorization")) -> bool:
-    """Verify the session token from Authorization header."""
+    name_b64 = _b64u(name.encode()) if name else b""
+    payload = timestamp + b"." + name_b64
+    return (payload + b"." + _b64u(_sign_payload(payload))).decode("ascii")
+
+
+def _request_now(request: Request | None) -> float:
+    """Arrival time stamped by log_requests, falling back to the clock."""
+    if request is not None:
+        now = getattr(request.state, "now", None)
+        if now is not None:
+            return now
+    return time.time()
+
+
+@dataclass(frozen=True)
+class SessionInfo:
+    """Parsed session token: validity, display name, and the 401 detail."""
+    valid: bool
+    name: str | None = None
+    error: str | None = None
+
+
+def get_session(request: Request, authorization: str | None = Header(None, alias="Authorization")) -> SessionInfo:
+    """
+    Parse and verify the Authorization header once per request.
+
+    Endpoints that need both the auth check and the user name used to
+    parse the header twice through separate dependencies; FastAPI caches
+    this dependency per request, so the split, HMAC verify and name
+    decode all happen exactly once however many deps hang off it.
+    """
     if not authorization:
-        raise HTTPException(status_code=401, detail="Authorization header required")
+        return SessionInfo(False, error="Authorization header required")
 
     parts = authorization.split(" ", 1)
     if len(parts) != 2 or parts[0].lower() != "bearer":
-        raise HTTPException(status_code=401, detail="Invalid authorization format")
+        return SessionInfo(False, error="Invalid authorization format")
 
     token = parts[1]
-    token_parts = token.split(".")
+    # Tokens are well under 200 chars; cap attacker-supplied input before
+    # doing any parsing on it
+    if len(token) > 1024:
+        return SessionInfo(False, error="Invalid token format")
+    token_parts = token.split(".", 2)
 
     # New format: timestamp.name_b64.signature (3 parts)
     # Old format: timestamp.signature (2 parts) - backwards compatible
     if len(token_parts) == 3:
         timestamp_str, name_b64, sig_b64 = token_parts
-        payload = f"{timestamp_str}.{name_b64}"
+        payload = f"{timestamp_str}.{name_b64}".encode()
     elif len(token_parts) == 2:
         timestamp_str, sig_b64 = token_parts
-        payload = timestamp_str
+        name_b64 = ""
+        payload = timestamp_str.encode()
     else:
-        raise HTTPException(status_code=401, detail="Invalid token format")
+        return SessionInfo(False, error="Invalid token format")
 
     try:
         timestamp = int(timestamp_str)
     except ValueError:
-        raise HTTPException(status_code=401, detail="Invalid token format")
+        return SessionInfo(False, error="Invalid token format")
 
-    if time.time() - timestamp > SESSION_DURATION_SECONDS:
-        raise HTTPException(status_code=401, detail="Session expired")
-
-    settings = get_settings_lazy()
-    expected_sig = hmac.new(
-        settings.app_secret_key.encode(),
-        payload.encode(),
-        hashlib.sha256
-    ).digest()
-    expected_b64 = base64.urlsafe_b64encode(expected_sig).decode().rstrip("=")
+    if _request_now(request) - timestamp > SESSION_DURATION_SECONDS:
+        return SessionInfo(False, error="Session expired")
 
-    if not secrets.compare_digest(sig_b64, expected_b64):
-        raise HTTPException(status_code=401, detail="Invalid token")
+    try:
+        # Decode the token's signature and compare raw digests; re-encoding
+        # the expected digest to base64 just to compare strings is wasted work
+        sig_bytes = base64.urlsafe_b64decode(sig_b64 + "=" * (-len(sig_b64) % 4))
+    except Exception:
+        return SessionInfo(False, error="Invalid token format")
 
-    return True
+    if not hmac.compare_digest(sig_bytes, _sign_payload(payload)):
+        return SessionInfo(False, error="Invalid token")
 
+    name = None
+    if name_b64:
+        try:
+            name = base64.urlsafe_b64decode(
+                name_b64 + "=" * (-len(name_b64) % 4)
+            ).decode("utf-8")
+        except Exception:
+            # A bad name doesn't invalidate an otherwise-signed token
+            name = None
 
-def get_user_from_token(authorization: str | None = Header(None, alias="Authorization")) -> str | None:
-    """Extract user name from session token. Returns None if not available."""
-    if not authorization:
-        return None
+    return SessionInfo(True, name=name)
 
-    parts = authorization.split(" ", 1)
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        return None
 
-    token = parts[1]
-    token_parts = token.split(".")
+def verify_session_token(session: SessionInfo = Depends(get_session)) -> bool:
+    """Verify the session token from Authorization header."""
+    if not session.valid:
+        raise HTTPException(status_code=401, detail=session.error)
+    return True
 
-    # New format: timestamp.name_b64.signature (3 parts)
-    if len(token_parts) == 3:
-        _, name_b64, _ = token_parts
-        if name_b64:
-            try:
-                # Restore padding for base64 decode
-                padding = 4 - (len(name_b64) % 4)
-                if padding != 4:
-                    name_b64 += '=' * padding
-                return base64.urlsafe_b64decode(name_b64).decode('utf-8')
-            except Exception:
-                return None
 
-    return None
+def get_user_from_token(session: SessionInfo = Depends(get_session)) -> str | None:
+    """Extract user name from session token. Returns None if not available."""
+    return session.name
 
 
 @asynccontextmanager
@@ -199,32 +257,54 @@ app = FastAPI(
     title="Stellarr",
     description="A lightweight media request system for Sonarr/Radarr",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson serializes the plain dict/list payloads here directly,
+    # skipping the jsonable_encoder pass of the default JSONResponse
+    default_response_class=ORJSONResponse
 )
 
-# CORS configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[ALLOWED_ORIGIN] if ALLOWED_ORIGIN != "*" else ["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS: the allowed origin is a single fixed value from env, so the full
+# CORSMiddleware (per-request origin matching, header parsing, its own
+# middleware layer) reduces to two static response headers and a canned
+# preflight reply emitted from the logging middleware below.
+_PREFLIGHT_HEADERS = {
+    "access-control-allow-origin": ALLOWED_ORIGIN,
+    "access-control-allow-credentials": "true",
+    "access-control-allow-methods": "GET, POST, DELETE, OPTIONS",
+    "access-control-max-age": "600",
+}
 
 
-# Request logging middleware
+# Request logging middleware (also emits the CORS headers)
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    print(f"DEBUG: REQUEST START - {request.method} {request.url.path}", flush=True)
+    # Health probes fire constantly - skip the timing and log record
+    if request.url.path == "/api/health":
+        return await call_next(request)
+
+    if request.method == "OPTIONS" and "origin" in request.headers:
+        headers = dict(_PREFLIGHT_HEADERS)
+        # Credentialed preflights can't use a wildcard - echo what was asked
+        requested_headers = request.headers.get("access-control-request-headers")
+        if requested_headers:
+            headers["access-control-allow-headers"] = requested_headers
+        return Response(status_code=204, headers=headers)
+
+    # perf_counter for the duration (monotonic, immune to NTP slew);
+    # one wall-clock read per request for downstream auth checks, which
+    # need absolute time and reuse this instead of re-reading the clock
+    start_time = time.perf_counter()
+    request.state.now = time.time()
     try:
         response = await call_next(request)
-        duration = time.time() - start_time
-        print(f"DEBUG: REQUEST END - {request.method} {request.url.path} - Status: {response.status_code} - Duration: {duration:.2f}s", flush=True)
+        response.headers["access-control-allow-origin"] = ALLOWED_ORIGIN
+        response.headers["access-control-allow-credentials"] = "true"
+        duration = time.perf_counter() - start_time
+        logger.info("%s %s - %s - %.3fs", request.method, request.url.path, response.status_code, duration)
         return response
     except Exception as e:
-        duration = time.time() - start_time
-        print(f"DEBUG: REQUEST ERROR - {request.method} {request.url.path} - Error: {type(e).__name__}: {e} - Duration: {duration:.2f}s", flush=True)
+        duration = time.perf_counter() - start_time
+        logger.error("%s %s - %s: %s - %.3fs", request.method, request.url.path, type(e).__name__, e, duration)
         raise
 
 
@@ -241,19 +321,35 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+# BASE_URL is set by Terraform (preferred for CloudFront) and never
+# changes within a Lambda instance - strip it once at import
+_BASE_URL_ENV = (os.environ.get("BASE_URL") or "").rstrip("/") or None
+
+
 def get_base_url(request: Request) -> str:
     """Get the base URL from environment variable (set by Terraform) or fallback."""
-    # Use BASE_URL env var set by Terraform (preferred for CloudFront)
-    base_url = os.environ.get("BASE_URL")
-    if base_url:
-        return base_url.rstrip("/")
-    return str(request.base_url).rstrip("/")
+    return _BASE_URL_ENV or str(request.base_url).rstrip("/")
+
+
+# Token snapshot for the per-request verifiers. Settings live in Secrets
+# Manager so this can't bind at import, but after the first load the
+# verifiers read a plain tuple instead of walking pydantic attributes.
+_hot_tokens = None
+
+
+def _get_hot_tokens():
+    """(feed_token, plex_webhook_token), fetched from settings once."""
+    global _hot_tokens
+    if _hot_tokens is None:
+        settings = get_settings_lazy()
+        _hot_tokens = (settings.feed_token, settings.plex_webhook_token)
+    return _hot_tokens
 
 
 def verify_feed_token(token: str | None = Query(None, alias="token")):
     """Verify the feed token for RSS/list endpoints."""
-    settings = get_settings_lazy()
-    if not settings.feed_token:
+    feed_token = _get_hot_tokens()[0]
+    if not feed_token:
         return True
 
     if not token:
@@ -262,7 +358,7 @@ def verify_feed_token(token: str | None = Query(None, alias="token")):
             detail="Feed token required. Add ?token=YOUR_TOKEN to the URL."
         )
 
-    if not secrets.compare_digest(token, settings.feed_token):
+    if not secrets.compare_digest(token, feed_token):
         raise HTTPException(status_code=401, detail="Invalid feed token")
 
     return True
@@ -270,9 +366,9 @@ def verify_feed_token(token: str | None = Query(None, alias="token")):
 
 def verify_plex_webhook_token(token: str | None = Query(None, alias="token")):
     """Verify the Plex webhook token."""
-    settings = get_settings_lazy()
+    webhook_token = _get_hot_tokens()[1]
 
-    if not settings.plex_webhook_token:
+    if not webhook_token:
         # No token configured - reject all requests for security
         raise HTTPException(
             status_code=401,
@@ -285,7 +381,7 @@ def verify_plex_webhook_token(token: str | None = Query(None, alias="token")):
             detail="Webhook token required. Add ?token=YOUR_TOKEN to the URL."
         )
 
-    if not secrets.compare_digest(token, settings.plex_webhook_token):
+    if not secrets.compare_digest(token, webhook_token):
         raise HTTPException(status_code=401, detail="Invalid webhook token")
 
     return True
@@ -296,8 +392,12 @@ def verify_plex_webhook_token(token: str | None = Query(None, alias="token")):
 # Maximum allowed time skew for challenge-response auth (5 minutes)
 AUTH_TIME_WINDOW_SECONDS = 300
 
-# PBKDF2 iterations (single source of truth - frontend fetches this)
-PBKDF2_ITERATIONS = 100000
+# PBKDF2 iterations (single source of truth - frontend fetches this from
+# /api/auth/params, so the value can be tuned per deployment via env).
+# The preshared password is an admin-chosen secret, not a user password;
+# operators who provision a high-entropy secret can lower this to trade
+# brute-force margin for auth latency.
+PBKDF2_ITERATIONS = int(os.environ.get('PBKDF2_ITERATIONS', '100000'))
 
 
 class AuthChallenge(BaseModel):
@@ -307,20 +407,32 @@ class AuthChallenge(BaseModel):
     name: str        # User's display name
 
 
-def verify_challenge_hash(origin: str, timestamp: int, provided_hash: str) -> bool:
-    """Verify the challenge-response hash with PBKDF2 key derivation."""
-    settings = get_settings_lazy()
-    # 1. Derive key using PBKDF2 (makes brute-force attacks expensive)
-    derived_key = hashlib.pbkdf2_hmac(
+@lru_cache(maxsize=16)
+def _derive_auth_key(password: bytes, origin: str) -> str:
+    """
+    Derive the PBKDF2 key for a password/origin pair, hex-encoded.
+
+    The derivation burns ~100k iterations by design; PBKDF2 is
+    deterministic, so cache it and pay that cost once per pair instead
+    of on every login attempt. The password is part of the key so a
+    changed secret can never serve a stale derivation. Rate limiting
+    runs before this, so the cache doesn't ease online brute-force.
+    """
+    return hashlib.pbkdf2_hmac(
         'sha256',
-        settings.preshared_password.encode(),
+        password,
         origin.encode(),
         PBKDF2_ITERATIONS,
         dklen=32  # 256 bits
-    )
-    derived_key_hex = derived_key.hex()
+    ).hex()
+
+
+def verify_challenge_hash(origin: str, timestamp: int, provided_hash: str) -> bool:
+    """Verify the challenge-response hash with PBKDF2 key derivation."""
+    settings = get_settings_lazy()
+    derived_key_hex = _derive_auth_key(settings.preshared_password.encode(), origin)
 
-    # 2. Compute expected hash: SHA256(derived_key:timestamp)
+    # Compute expected hash: SHA256(derived_key:timestamp)
     challenge_string = f"{derived_key_hex}:{timestamp}"
     expected_hash = hashlib.sha256(challenge_string.encode()).hexdigest()
 
@@ -328,17 +440,18 @@ def verify_challenge_hash(origin: str, timestamp: int, provided_hash: str) -> bo
 
 
 @app.get("/api/auth/params")
-def get_auth_params():
+async def get_auth_params():
     """Return auth parameters (PBKDF2 iterations) for frontend."""
     return {"iterations": PBKDF2_ITERATIONS}
 
 
 @app.post("/api/auth/verify")
-def verify_auth(data: AuthChallenge, request: Request):
+async def verify_auth(data: AuthChallenge, request: Request):
     """Verify challenge-response auth and return a session token."""
     client_ip = get_client_ip(request)
 
     # Check rate limit BEFORE expensive PBKDF2 computation
+    remaining = RATE_LIMIT_MAX_ATTEMPTS
     if RATE_LIMIT_ENABLED:
         db = get_database()
         allowed, remaining = db.check_rate_limit(
@@ -350,7 +463,7 @@ def verify_auth(data: AuthChallenge, request: Request):
                 detail=f"Too many failed attempts. Try again in {RATE_LIMIT_WINDOW_SECONDS // 60} minutes."
             )
 
-    current_time = int(time.time())
+    current_time = int(_request_now(request))
 
     # Check timestamp is within allowed window
     time_diff = abs(current_time - data.timestamp)
@@ -373,8 +486,10 @@ def verify_auth(data: AuthChallenge, request: Request):
     if not name or len(name) > 50:
         raise HTTPException(status_code=400, detail="Name is required (max 50 chars)")
 
-    # Clear rate limit on successful auth
-    if RATE_LIMIT_ENABLED:
+    # Clear rate limit on successful auth - but only when there is a
+    # counter to clear; the common clean-login case otherwise paid a
+    # DeleteItem round-trip for a record that doesn't exist
+    if RATE_LIMIT_ENABLED and remaining < RATE_LIMIT_MAX_ATTEMPTS:
         db = get_database()
         db.clear_rate_limit(client_ip)
 
@@ -382,8 +497,36 @@ def verify_auth(data: AuthChallenge, request: Request):
     return {"valid": True, "token": token, "name": name}
 
 
+def _parse_year(item: dict, key: str) -> int | None:
+    """Pull the 4-digit year out of a TMDB date field, if usable."""
+    value = item.get(key)
+    return int(value[:4]) if value and value[:4].isdigit() else None
+
+
+# (title field, date field) per media type - same table the cache warmer
+# uses, so projection logic branches once through a dict instead of
+# repeating if/else chains at every call site
+MEDIA_KEYS = {
+    "tv": ("name", "first_air_date"),
+    "movie": ("title", "release_date"),
+}
+
+
+def _title_and_year(item: dict, media_type: str) -> tuple[str, int | None]:
+    """Resolve the media-type-specific title and year from a TMDB payload."""
+    title_key, date_key = MEDIA_KEYS.get(media_type, MEDIA_KEYS["movie"])
+    return item.get(title_key, "Unknown"), _parse_year(item, date_key)
+
+
 # --- Search ---
 
+# Season counts barely move - cache them so repeat searches for popular
+# shows skip the per-show TMDB round trip entirely
+_tv_seasons_cache: dict[int, tuple[float, int]] = {}
+_TV_SEASONS_TTL = 3600.0  # seconds
+_TV_SEASONS_CACHE_MAX = 1024
+
+
 class SearchQuery(BaseModel):
     query: str
     media_type: str | None = None
@@ -407,31 +550,36 @@ async def search(data: SearchQuery, _: bool = Depends(verify_session_token)):
         items = []
         tv_shows_to_fetch = []  # (index, tmdb_id) for TV shows needing season count
 
-        for item in results.get("results", []):
-            if item.get("media_type") == "person":
-                continue
+        candidates = [
+            (item, item.get("media_type", data.media_type or "movie"))
+            for item in results.get("results", [])
+            if item.get("media_type") != "person"
+        ]
 
-            media_type = item.get("media_type", data.media_type or "movie")
-            tmdb_id = item.get("id")
+        # Two batched existence checks for the whole page instead of a
+        # DynamoDB round-trip per result per table
+        pairs = [(item.get("id"), media_type) for item, media_type in candidates]
+        requested_set = db.is_requested_bulk(pairs)
+        library_set = db.is_in_library_bulk(pairs)
 
-            if media_type == "tv":
-                title = item.get("name", "Unknown")
-                year = item.get("first_air_date", "")[:4] if item.get("first_air_date") else None
-            else:
-                title = item.get("title", "Unknown")
-                year = item.get("release_date", "")[:4] if item.get("release_date") else None
+        for item, media_type in candidates:
+            # Bind the bound-method once - each .get below is a hash+probe,
+            # and this loop runs for every result on the page
+            get = item.get
+            tmdb_id = get("id")
+            title, year = _title_and_year(item, media_type)
 
-            requested = db.is_requested(tmdb_id, media_type)
-            in_library = db.is_in_library(tmdb_id, media_type)
+            requested = (tmdb_id, media_type) in requested_set
+            in_library = (tmdb_id, media_type) in library_set
 
             item_data = {
                 "id": tmdb_id,
                 "title": title,
-                "year": int(year) if year else None,
-                "overview": item.get("overview"),
-                "poster_path": item.get("poster_path"),
+                "year": year,
+                "overview": get("overview"),
+                "poster_path": get("poster_path"),
                 "media_type": media_type,
-                "vote_average": item.get("vote_average"),
+                "vote_average": get("vote_average"),
                 "requested": requested,
                 "in_library": in_library,
                 "number_of_seasons": None
@@ -442,20 +590,38 @@ async def search(data: SearchQuery, _: bool = Depends(verify_session_token)):
             if media_type == "tv" and not requested and not in_library:
                 tv_shows_to_fetch.append((len(items) - 1, tmdb_id))
 
-        # Fetch season counts for TV shows in parallel
+        # Fill season counts: cached shows first, then fetch the rest in
+        # parallel (bounded, so a big page can't open a socket per show)
         if tv_shows_to_fetch:
-            async def fetch_seasons(idx, show_id):
-                try:
-                    details = await tmdb.get_tv(show_id)
-                    return idx, details.get("number_of_seasons")
-                except Exception:
-                    return idx, None
-
-            season_results = await asyncio.gather(
-                *[fetch_seasons(idx, show_id) for idx, show_id in tv_shows_to_fetch]
-            )
-            for idx, num_seasons in season_results:
-                items[idx]["number_of_seasons"] = num_seasons
+            now = time.monotonic()
+            to_fetch = []
+            for idx, show_id in tv_shows_to_fetch:
+                hit = _tv_seasons_cache.get(show_id)
+                if hit and now - hit[0] < _TV_SEASONS_TTL:
+                    items[idx]["number_of_seasons"] = hit[1]
+                else:
+                    to_fetch.append((idx, show_id))
+
+            if to_fetch:
+                sem = asyncio.Semaphore(8)
+
+                async def fetch_seasons(idx, show_id):
+                    try:
+                        async with sem:
+                            details = await tmdb.get_tv(show_id)
+                        return idx, show_id, details.get("number_of_seasons")
+                    except Exception:
+                        return idx, show_id, None
+
+                season_results = await asyncio.gather(
+                    *[fetch_seasons(idx, show_id) for idx, show_id in to_fetch]
+                )
+                if len(_tv_seasons_cache) >= _TV_SEASONS_CACHE_MAX:
+                    _tv_seasons_cache.clear()
+                for idx, show_id, num_seasons in season_results:
+                    items[idx]["number_of_seasons"] = num_seasons
+                    if num_seasons is not None:
+                        _tv_seasons_cache[show_id] = (now, num_seasons)
 
         return {
             "results": items,
@@ -483,22 +649,19 @@ async def create_request(data: MediaRequest, _: bool = Depends(verify_session_to
     try:
         if data.media_type == "movie":
             details = await tmdb.get_movie(data.tmdb_id)
-            title = details.get("title", "Unknown")
-            year = details.get("release_date", "")[:4] if details.get("release_date") else None
-            imdb_id = details.get("external_ids", {}).get("imdb_id")
             tvdb_id = None
         else:
             details = await tmdb.get_tv(data.tmdb_id)
-            title = details.get("name", "Unknown")
-            year = details.get("first_air_date", "")[:4] if details.get("first_air_date") else None
-            imdb_id = details.get("external_ids", {}).get("imdb_id")
             tvdb_id = details.get("external_ids", {}).get("tvdb_id")
 
+        title, year = _title_and_year(details, data.media_type)
+        imdb_id = details.get("external_ids", {}).get("imdb_id")
+
         success = db.add_request(
             tmdb_id=data.tmdb_id,
             media_type=data.media_type,
             title=title,
-            year=int(year) if year else None,
+            year=year,
             overview=details.get("overview"),
             poster_path=details.get("poster_path"),
             imdb_id=imdb_id,
@@ -515,7 +678,7 @@ async def create_request(data: MediaRequest, _: bool = Depends(verify_session_to
 
 
 @app.delete("/api/request/{media_type}/{tmdb_id}")
-def delete_request(media_type: str, tmdb_id: int, _: bool = Depends(verify_session_token)):
+async def delete_request(media_type: str, tmdb_id: int, _: bool = Depends(verify_session_token)):
     """Remove a media item from the request list."""
     db = get_database()
     success = db.remove_request(tmdb_id, media_type)
@@ -525,7 +688,7 @@ def delete_request(media_type: str, tmdb_id: int, _: bool = Depends(verify_sessi
 
 
 @app.get("/api/requests")
-def list_requests(media_type: str | None = None, _: bool = Depends(verify_session_token)):
+async def list_requests(media_type: str | None = None, _: bool = Depends(verify_session_token)):
     """Get all requests, optionally filtered by media type."""
     db = get_database()
     requests = db.get_all_requests(media_type)
@@ -535,7 +698,7 @@ def list_requests(media_type: str | None = None, _: bool = Depends(verify_sessio
 # --- Library Status (for frontend caching) ---
 
 @app.get("/api/library-status")
-def get_library_status(_: bool = Depends(verify_session_token)):
+async def get_library_status(_: bool = Depends(verify_session_token)):
     """
     Get library and request status for frontend caching.
     Used to hydrate trending/search results with user-specific status.
@@ -564,7 +727,7 @@ class PushSubscription(BaseModel):
 
 
 @app.get("/api/push/vapid-public-key")
-def get_vapid_public_key(_: bool = Depends(verify_session_token)):
+async def get_vapid_public_key(_: bool = Depends(verify_session_token)):
     """Get VAPID public key for push subscription."""
     # Public key is passed via environment variable (generated by Terraform)
     # This avoids loading the cryptography library just for the public key
@@ -576,7 +739,7 @@ def get_vapid_public_key(_: bool = Depends(verify_session_token)):
 
 
 @app.post("/api/push/subscribe")
-def subscribe_push(
+async def subscribe_push(
     subscription: PushSubscription,
     user_name: str = Depends(get_user_from_token)
 ):
@@ -593,24 +756,24 @@ def subscribe_push(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to save subscription")
 
-    print(f"PUSH: Subscribed user '{user_name}'", flush=True)
+    logger.info("PUSH: Subscribed user %r", user_name)
     return {"status": "subscribed"}
 
 
 @app.delete("/api/push/subscribe")
-def unsubscribe_push(user_name: str = Depends(get_user_from_token)):
+async def unsubscribe_push(user_name: str = Depends(get_user_from_token)):
     """Unsubscribe from push notifications."""
     if not user_name:
         raise HTTPException(status_code=401, detail="User name required")
 
     db = get_database()
     db.delete_push_subscription(user_name)
-    print(f"PUSH: Unsubscribed user '{user_name}'", flush=True)
+    logger.info("PUSH: Unsubscribed user %r", user_name)
     return {"status": "unsubscribed"}
 
 
 @app.get("/api/push/status")
-def get_push_status(user_name: str = Depends(get_user_from_token)):
+async def get_push_status(user_name: str = Depends(get_user_from_token)):
     """Check if user has an active push subscription."""
     if not user_name:
         return {"subscribed": False}
@@ -632,13 +795,13 @@ def send_fulfillment_notification(request_data: dict) -> bool:
 
     requested_by = request_data.get('requested_by')
     if not requested_by:
-        print("PUSH: No requested_by in request, skipping notification", flush=True)
+        logger.info("PUSH: No requested_by in request, skipping notification")
         return False
 
     db = get_database()
     subscription = db.get_push_subscription(requested_by)
     if not subscription:
-        print(f"PUSH: No subscription for user '{requested_by}', skipping notification", flush=True)
+        logger.info("PUSH: No subscription for user %r, skipping notification", requested_by)
         return False
 
     title = request_data.get('title', 'Unknown')
@@ -667,21 +830,21 @@ def send_fulfillment_notification(request_data: dict) -> bool:
             vapid_claims={"sub": "mailto:admin@example.com"}
         )
         if success:
-            print(f"PUSH: Sent notification to '{requested_by}' for '{title}'", flush=True)
+            logger.info("PUSH: Sent notification to %r for %r", requested_by, title)
         else:
             # Subscription invalid/expired - clean it up
-            print(f"PUSH: Subscription expired for '{requested_by}', removing", flush=True)
+            logger.info("PUSH: Subscription expired for %r, removing", requested_by)
             db.delete_push_subscription(requested_by)
         return success
     except Exception as e:
-        print(f"PUSH: Error sending notification to '{requested_by}': {e}", flush=True)
+        logger.error("PUSH: Error sending notification to %r: %s", requested_by, e)
         return False
 
 
 # --- JSON Lists for Sonarr/Radarr ---
 
 @app.get("/list/radarr")
-def list_radarr(_: bool = Depends(verify_feed_token)):
+async def list_radarr(_: bool = Depends(verify_feed_token)):
     """Radarr StevenLu Custom list format (JSON)."""
     db = get_database()
     all_requests = db.get_all_requests(media_type="movie")
@@ -703,7 +866,7 @@ def list_radarr(_: bool = Depends(verify_feed_token)):
 
 
 @app.get("/list/sonarr")
-def list_sonarr(_: bool = Depends(verify_feed_token)):
+async def list_sonarr(_: bool = Depends(verify_feed_token)):
     """Sonarr Custom List format (JSON)."""
     db = get_database()
     all_requests = db.get_all_requests(media_type="tv")
@@ -720,15 +883,27 @@ def list_sonarr(_: bool = Depends(verify_feed_token)):
 
 # --- Feed Info ---
 
+# Feed info only varies by base URL (fixed per instance via the BASE_URL
+# env var), so serialize it once and replay the bytes. Without BASE_URL
+# the key derives from the Host header, so cap the dict like the docker
+# backend does - a client must not be able to grow it unbounded.
+_feed_info_bodies: dict[str, bytes] = {}
+_FEED_INFO_CACHE_MAX = 8
+
+
 @app.get("/api/feeds")
-def get_feed_info(request: Request):
+async def get_feed_info(request: Request):
     """Get information about available feeds and their URLs."""
-    settings = get_settings_lazy()
     base_url = get_base_url(request)
+    cached = _feed_info_bodies.get(base_url)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    settings = get_settings_lazy()
     token_required = bool(settings.feed_token)
     token_param = "?token=YOUR_FEED_TOKEN" if token_required else ""
 
-    return {
+    info = {
         "token_required": token_required,
         "feeds": {
             "radarr": {
@@ -748,11 +923,17 @@ def get_feed_info(request: Request):
         }
     }
 
+    body = json.dumps(info).encode()
+    if len(_feed_info_bodies) >= _FEED_INFO_CACHE_MAX:
+        _feed_info_bodies.clear()
+    _feed_info_bodies[base_url] = body
+    return Response(content=body, media_type="application/json")
+
 
 # --- Health Check ---
 
 @app.get("/api/health")
-def health_check():
+async def health_check():
     """Health check endpoint - no dependencies, fastest possible response."""
     return {"status": "healthy", "service": "stellarr"}
 
@@ -760,7 +941,7 @@ def health_check():
 # --- Plex Webhook ---
 
 @app.post("/webhook/plex")
-def plex_webhook(
+async def plex_webhook(
     payload: str = Form(...),
     _: bool = Depends(verify_plex_webhook_token)
 ):
@@ -774,16 +955,15 @@ def plex_webhook(
     Configure in Plex: Settings -> Webhooks -> Add
     URL: https://your-domain.com/webhook/plex?token=YOUR_PLEX_WEBHOOK_TOKEN
     """
-    import json
-
     settings = get_settings_lazy()
     db = get_database()
     plex = get_plex_module()
 
     try:
-        data = json.loads(payload)
-    except json.JSONDecodeError:
-        print("WEBHOOK: Invalid JSON payload received", flush=True)
+        # Plex payloads run to several KB - orjson parses them in C
+        data = orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        logger.warning("WEBHOOK: Invalid JSON payload received")
         raise HTTPException(status_code=400, detail="Invalid JSON payload")
 
     # Extract key info for logging
@@ -793,27 +973,27 @@ def plex_webhook(
     media_title = metadata.get('title', metadata.get('grandparentTitle', 'unknown'))
     media_type_raw = metadata.get('type', 'unknown')
 
-    print(f"WEBHOOK: Received event='{event}' server='{server_title}' type='{media_type_raw}' title='{media_title}'", flush=True)
+    logger.info("WEBHOOK: Received event=%r server=%r type=%r title=%r", event, server_title, media_type_raw, media_title)
 
     # Check event type - only process library.new
     if event != 'library.new':
-        print(f"WEBHOOK: Ignored - event type '{event}' not processed", flush=True)
+        logger.info("WEBHOOK: Ignored - event type %r not processed", event)
         return {"status": "ignored", "reason": f"Event type '{event}' not processed"}
 
     # Validate server name if configured
     if settings.plex_server_name:
         if server_title != settings.plex_server_name:
-            print(f"WEBHOOK: Ignored - server mismatch (expected='{settings.plex_server_name}', got='{server_title}')", flush=True)
+            logger.info("WEBHOOK: Ignored - server mismatch (expected=%r, got=%r)", settings.plex_server_name, server_title)
             return {"status": "ignored", "reason": "Server name mismatch"}
 
     # Parse the payload
     media = plex.parse_plex_payload(data)
 
     if not media:
-        print(f"WEBHOOK: Ignored - unsupported media type '{media_type_raw}'", flush=True)
+        logger.info("WEBHOOK: Ignored - unsupported media type %r", media_type_raw)
         return {"status": "ignored", "reason": "Unsupported media type"}
 
-    print(f"WEBHOOK: Parsed media - title='{media.title}' type='{media.media_type}' plex_type='{media.plex_type}' tmdb={media.tmdb_id} tvdb={media.tvdb_id}", flush=True)
+    logger.info("WEBHOOK: Parsed media - title=%r type=%r plex_type=%r tmdb=%s tvdb=%s", media.title, media.media_type, media.plex_type, media.tmdb_id, media.tvdb_id)
 
     # For episodes/seasons, the tmdb_id from the Guid array is episode/season-level, not show-level.
     # We need to resolve show-level IDs before adding to library or matching.
@@ -828,13 +1008,13 @@ def plex_webhook(
             show_tmdb_id = cached.get('tmdb_id')
             show_tvdb_id = cached.get('tvdb_id')
             resolved_from_cache = True
-            print(f"WEBHOOK: Cache hit for plex_guid - show tmdb={show_tmdb_id} tvdb={show_tvdb_id}", flush=True)
+            logger.info("WEBHOOK: Cache hit for plex_guid - show tmdb=%s tvdb=%s", show_tmdb_id, show_tvdb_id)
         else:
             # For episodes/seasons, the IDs in Guid array are NOT show-level
             # Clear them so we don't incorrectly add episode IDs to library
             show_tmdb_id = None
             show_tvdb_id = None
-            print(f"WEBHOOK: Cache miss for plex_guid - need to resolve show IDs", flush=True)
+            logger.info("WEBHOOK: Cache miss for plex_guid - need to resolve show IDs")
 
     # Add to library only if we have a show-level TMDB ID (not episode-level)
     added_to_library = False
@@ -845,7 +1025,7 @@ def plex_webhook(
             clear_first=False
         )
         added_to_library = True
-        print(f"WEBHOOK: Added to library - tmdb={show_tmdb_id} type='{media.media_type}'", flush=True)
+        logger.info("WEBHOOK: Added to library - tmdb=%s type=%r", show_tmdb_id, media.media_type)
 
     # Try to match and update request using our matching strategy
     # matched_request now contains the full request data (for push notifications)
@@ -855,7 +1035,7 @@ def plex_webhook(
     if show_tmdb_id:
         matched_request = db.mark_as_added(show_tmdb_id, media.media_type)
         if matched_request:
-            print(f"WEBHOOK: Matched request by TMDB ID {show_tmdb_id}", flush=True)
+            logger.info("WEBHOOK: Matched request by TMDB ID %s", show_tmdb_id)
             # Cache the plex_guid for future episode webhooks
             if media.plex_guid:
                 db.update_plex_guid(show_tmdb_id, media.media_type, media.plex_guid)
@@ -867,7 +1047,7 @@ def plex_webhook(
         if found_request:
             matched_request = db.mark_as_added(found_request['tmdb_id'], media.media_type)
             if matched_request:
-                print(f"WEBHOOK: Matched request by TVDB ID {show_tvdb_id} -> TMDB {found_request['tmdb_id']}", flush=True)
+                logger.info("WEBHOOK: Matched request by TVDB ID %s -> TMDB %s", show_tvdb_id, found_request['tmdb_id'])
                 if media.plex_guid:
                     db.update_plex_guid(found_request['tmdb_id'], media.media_type, media.plex_guid)
                     db.set_plex_guid_cache(media.plex_guid, found_request['tmdb_id'], show_tvdb_id)
@@ -878,7 +1058,7 @@ def plex_webhook(
         if found_request:
             matched_request = db.mark_as_added(found_request['tmdb_id'], found_request['media_type'])
             if matched_request:
-                print(f"WEBHOOK: Matched request by Plex GUID -> TMDB {found_request['tmdb_id']}", flush=True)
+                logger.info("WEBHOOK: Matched request by Plex GUID -> TMDB %s", found_request['tmdb_id'])
                 # Also update the GUID cache if we matched from the request table
                 if not resolved_from_cache:
                     db.set_plex_guid_cache(media.plex_guid, found_request['tmdb_id'], found_request.get('tvdb_id'))
@@ -886,19 +1066,16 @@ def plex_webhook(
     # 4. Try TVDB reverse lookup (episode TVDB ID → show TVDB ID)
     # Only do this if we have an episode TVDB ID and haven't matched yet
     if not matched_request and media.episode_tvdb_id:
-        import asyncio
         tvdb = get_tvdb_module()
-        print(f"WEBHOOK: Attempting TVDB reverse lookup for episode {media.episode_tvdb_id}", flush=True)
-        show_tvdb_id_resolved = asyncio.get_event_loop().run_until_complete(
-            tvdb.get_series_id_from_episode(media.episode_tvdb_id)
-        )
+        logger.info("WEBHOOK: Attempting TVDB reverse lookup for episode %s", media.episode_tvdb_id)
+        show_tvdb_id_resolved = await tvdb.get_series_id_from_episode(media.episode_tvdb_id)
         if show_tvdb_id_resolved:
-            print(f"WEBHOOK: TVDB reverse lookup found show tvdb={show_tvdb_id_resolved}", flush=True)
+            logger.info("WEBHOOK: TVDB reverse lookup found show tvdb=%s", show_tvdb_id_resolved)
             found_request = db.find_by_tvdb_id(show_tvdb_id_resolved, 'tv')
             if found_request:
                 matched_request = db.mark_as_added(found_request['tmdb_id'], 'tv')
                 if matched_request:
-                    print(f"WEBHOOK: Matched request by TVDB reverse lookup - episode {media.episode_tvdb_id} -> show {show_tvdb_id_resolved} -> TMDB {found_request['tmdb_id']}", flush=True)
+                    logger.info("WEBHOOK: Matched request by TVDB reverse lookup - episode %s -> show %s -> TMDB %s", media.episode_tvdb_id, show_tvdb_id_resolved, found_request['tmdb_id'])
                     if media.plex_guid:
                         db.update_plex_guid(found_request['tmdb_id'], 'tv', media.plex_guid)
                         # Cache for future episode webhooks of this show
@@ -914,17 +1091,17 @@ def plex_webhook(
                 else:
                     # Cache just the TVDB ID - future lookups can use this
                     db.set_plex_guid_cache(media.plex_guid, None, show_tvdb_id_resolved)
-                    print(f"WEBHOOK: Cached plex_guid -> tvdb={show_tvdb_id_resolved} (no TMDB match)", flush=True)
+                    logger.info("WEBHOOK: Cached plex_guid -> tvdb=%s (no TMDB match)", show_tvdb_id_resolved)
 
     # 5. Try title-based matching as fallback (for unmatched Plex imports)
     # Only attempt if we still haven't matched and have no TMDB/TVDB IDs
     if not matched_request and not show_tmdb_id and not show_tvdb_id:
-        print(f"WEBHOOK: No IDs available, attempting title match for '{media.title}'", flush=True)
+        logger.info("WEBHOOK: No IDs available, attempting title match for %r", media.title)
         found_request = db.find_by_title(media.title, media.media_type, media.year)
         if found_request:
             matched_request = db.mark_as_added(found_request['tmdb_id'], media.media_type)
             if matched_request:
-                print(f"WEBHOOK: Matched request by title '{media.title}' -> TMDB {found_request['tmdb_id']}", flush=True)
+                logger.info("WEBHOOK: Matched request by title %r -> TMDB %s", media.title, found_request['tmdb_id'])
                 # Add to library using the request's TMDB ID
                 db.sync_library(
                     [{"tmdb_id": found_request['tmdb_id'], "tvdb_id": found_request.get('tvdb_id'), "title": media.title}],
@@ -937,7 +1114,7 @@ def plex_webhook(
                     db.update_plex_guid(found_request['tmdb_id'], media.media_type, media.plex_guid)
                     db.set_plex_guid_cache(media.plex_guid, found_request['tmdb_id'], found_request.get('tvdb_id'))
         else:
-            print(f"WEBHOOK: Title match failed - no unique match found", flush=True)
+            logger.info("WEBHOOK: Title match failed - no unique match found")
 
     # Send push notification if we matched a request
     notification_sent = False
@@ -956,7 +1133,7 @@ def plex_webhook(
         "matched_request": matched_request is not None,
         "notification_sent": notification_sent
     }
-    print(f"WEBHOOK: Complete - {result}", flush=True)
+    logger.info("WEBHOOK: Complete - %s", result)
 
     return result
 
@@ -991,14 +1168,14 @@ async def sync_library_endpoint(
     try:
         data = await request.json()
     except json.JSONDecodeError:
-        print(f"SYNC: Invalid JSON body for media_type='{media_type}'", flush=True)
+        logger.warning("SYNC: Invalid JSON body for media_type=%r", media_type)
         raise HTTPException(status_code=400, detail="Invalid JSON body")
 
     if not isinstance(data, list):
-        print(f"SYNC: Body is not a list for media_type='{media_type}'", flush=True)
+        logger.warning("SYNC: Body is not a list for media_type=%r", media_type)
         raise HTTPException(status_code=400, detail="Body must be a JSON array")
 
-    print(f"SYNC: Starting sync for media_type='{media_type}' count={len(data)} clear={clear}", flush=True)
+    logger.info("SYNC: Starting sync for media_type=%r count=%d clear=%s", media_type, len(data), clear)
 
     # Sync the library
     count = db.sync_library(data, media_type, clear_first=clear)
@@ -1017,12 +1194,63 @@ async def sync_library_endpoint(
         "marked_as_added": marked,
         "media_type": media_type
     }
-    print(f"SYNC: Complete - {result}", flush=True)
+    logger.info("SYNC: Complete - %s", result)
 
     return result
 
 
-print("DEBUG: Module load complete, handler ready", flush=True)
+def _warm_imports():
+    """
+    Pre-load the heavy lazy modules (settings, database, TMDB client) so the
+    first real request doesn't pay their import cost. Runs on a background
+    thread during the Lambda INIT window, where CPU is boosted and the
+    wall-clock wait is free; failures just fall back to lazy loading.
+    """
+    try:
+        get_settings_lazy()
+        get_database()
+        get_tmdb_client()
+        _get_session_hmac()
+        _get_hot_tokens()
+    except Exception:
+        logger.debug("Background import warm-up failed", exc_info=True)
+
+
+if os.environ.get('AWS_LAMBDA_FUNCTION_NAME'):
+    threading.Thread(target=_warm_imports, daemon=True).start()
+
+# Lambda handler - lifespan="off" since we handle init lazily. Pinning
+# text_mime_types to what this API actually serves lets Mangum answer its
+# "should I base64 this body?" check with one list lookup instead of
+# walking its default mimetype heuristics per response.
+_mangum_handler = Mangum(
+    app,
+    lifespan="off",
+    api_gateway_base_path="/",
+    text_mime_types=["application/json", "application/rss+xml", "text/plain"],
+)
 
-# Lambda handler - lifespan="off" since we handle init lazily
-handler = Mangum(app, lifespan="off")
+# Pre-serialized bodies for the two static, unauthenticated GETs. Serving
+# them straight from the event skips ASGI scope construction and FastAPI
+# routing entirely - health probes are the single biggest traffic class.
+_FAST_BODIES = {
+    '/api/health': '{"status": "healthy", "service": "stellarr"}',
+    '/api/auth/params': json.dumps({"iterations": PBKDF2_ITERATIONS}),
+}
+_FAST_HEADERS = {
+    'content-type': 'application/json',
+    'access-control-allow-origin': ALLOWED_ORIGIN,
+}
+
+
+def handler(event, context):
+    """Lambda entrypoint - static GETs short-circuit, everything else goes through Mangum."""
+    body = _FAST_BODIES.get(event.get('rawPath') or event.get('path'))
+    if body is not None:
+        method = (
+            event.get('requestContext', {}).get('http', {}).get('method')
+            or event.get('httpMethod')
+        )
+        if method == 'GET':
+            return {'statusCode': 200, 'headers': _FAST_HEADERS, 'body': body}
+    return _mangum_handler(event, context)
@@ -12,6 +12,9 @@ class Settings(BaseSettings):
     plex_webhook_token: str = ""  # Token for Plex webhook authentication
     plex_server_name: str = ""  # Optional Plex server name for validation
     tvdb_api_key: str = ""  # TVDB API key for episode-to-show lookups
+    enable_cors: bool = True  # Disable when a proxy/CDN in front handles CORS
+    enable_docs: bool = True  # Disable /docs, /redoc and /openapi.json in production
+    cors_origins: str = "*"  # Comma-separated list of allowed origins
 
     class Config:
         env_file = ".env"
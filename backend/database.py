@@ -1,9 +1,13 @@
+import logging
+
 import aiosqlite
 from config import get_settings
 from pathlib import Path
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 
 async def init_db():
     """Initialize the database with required tables."""
@@ -93,7 +97,7 @@ async def add_request(
             await db.commit()
             return True
         except Exception as e:
-            print(f"Error adding request: {e}")
+            logger.error("Error adding request: %s", e)
             return False
 
 
@@ -108,7 +112,7 @@ async def remove_request(tmdb_id: int, media_type: str) -> bool:
             await db.commit()
             return True
         except Exception as e:
-            print(f"Error removing request: {e}")
+            logger.error("Error removing request: %s", e)
             return False
 
 
@@ -140,6 +144,30 @@ async def is_requested(tmdb_id: int, media_type: str) -> bool:
         return row is not None
 
 
+async def is_requested_many(pairs: list[tuple[int, str]]) -> set[tuple[int, str]]:
+    """
+    Check which (tmdb_id, media_type) pairs have existing requests.
+
+    One IN query instead of a SELECT per pair - search pages probe up
+    to 20 items at once.
+    """
+    if not pairs:
+        return set()
+
+    unique_pairs = list(dict.fromkeys(pairs))
+    placeholders = ", ".join("(?, ?)" for _ in unique_pairs)
+    params = [value for pair in unique_pairs for value in pair]
+
+    async with aiosqlite.connect(settings.database_path) as db:
+        cursor = await db.execute(
+            f"SELECT tmdb_id, media_type FROM requests "
+            f"WHERE (tmdb_id, media_type) IN (VALUES {placeholders})",
+            params
+        )
+        rows = await cursor.fetchall()
+        return {(row[0], row[1]) for row in rows}
+
+
 async def mark_as_added(tmdb_id: int, media_type: str) -> bool:
     """Mark a request as added to Plex library."""
     async with aiosqlite.connect(settings.database_path) as db:
@@ -155,7 +183,7 @@ async def mark_as_added(tmdb_id: int, media_type: str) -> bool:
             await db.commit()
             return cursor.rowcount > 0
         except Exception as e:
-            print(f"Error marking request as added: {e}")
+            logger.error("Error marking request as added: %s", e)
             return False
 
 
@@ -198,7 +226,7 @@ async def update_plex_guid(tmdb_id: int, media_type: str, plex_guid: str) -> boo
             await db.commit()
             return True
         except Exception as e:
-            print(f"Error updating plex_guid: {e}")
+            logger.error("Error updating plex_guid: %s", e)
             return False
 
 
@@ -220,20 +248,23 @@ async def sync_library(items: list[dict], media_type: str, clear_first: bool = F
                     (media_type,)
                 )
 
-            # Insert/update items
-            for item in items:
-                await db.execute(
-                    """
-                    INSERT OR REPLACE INTO library (tmdb_id, media_type, tvdb_id, title)
-                    VALUES (?, ?, ?, ?)
-                    """,
+            # Insert/update items in one executemany batch - a single
+            # statement submission and one commit for the whole sync
+            await db.executemany(
+                """
+                INSERT OR REPLACE INTO library (tmdb_id, media_type, tvdb_id, title)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
                     (item['tmdb_id'], media_type, item.get('tvdb_id'), item.get('title'))
-                )
+                    for item in items
+                ]
+            )
 
             await db.commit()
             return len(items)
         except Exception as e:
-            print(f"Error syncing library: {e}")
+            logger.error("Error syncing library: %s", e)
             return 0
 
 
@@ -302,7 +333,7 @@ async def set_plex_guid_cache(plex_guid: str, tmdb_id: int | None, tvdb_id: int
             await db.commit()
             return True
         except Exception as e:
-            print(f"Error setting plex_guid cache: {e}")
+            logger.error("Error setting plex_guid cache: %s", e)
             return False
 
 
@@ -349,7 +380,7 @@ async def set_trending_key(key: str) -> bool:
             await db.commit()
             return True
         except Exception as e:
-            print(f"Error setting trending key: {e}")
+            logger.error("Error setting trending key: %s", e)
             return False
 
 
@@ -360,7 +391,7 @@ async def get_or_create_trending_key() -> str:
     if not key:
         key = sec.token_urlsafe(32)
         await set_trending_key(key)
-        print(f"Generated new trending key")
+        logger.info("Generated new trending key")
     return key
 
 
@@ -1,8 +1,11 @@
 from fastapi import FastAPI, HTTPException, Depends, Request, Response, Query, Header, Form
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.routing import Route
 from contextlib import asynccontextmanager
+from functools import lru_cache
 import asyncio
+import logging
 import secrets
 import hmac
 import hashlib
@@ -10,39 +13,84 @@ import base64
 import time
 
 from config import get_settings
-from database import (
-    init_db, add_request, remove_request, get_all_requests, is_requested,
-    mark_as_added, find_by_tvdb_id, find_by_plex_guid, update_plex_guid,
-    sync_library, is_in_library, get_plex_guid_cache, set_plex_guid_cache,
-    get_all_library_tmdb_ids, find_by_title
-)
 import json
-from tmdb import tmdb_client
-from rss import (
-    generate_movie_rss,
-    generate_tv_rss,
-    generate_combined_rss,
-    generate_radarr_json,
-    generate_sonarr_json,
-)
 
 
 settings = get_settings()
 
+# uvicorn only configures its own uvicorn.* loggers - without a root
+# handler the app loggers (here, database, tvdb) would drop everything
+# below WARNING, losing the WEBHOOK:/SYNC: lines operators filter on
+logging.basicConfig(level=logging.INFO)
+
+logger = logging.getLogger(__name__)
+
+# Lazy imports - the database, TMDB client and RSS generators are only
+# loaded when first needed, keeping startup (and tooling imports) off
+# the hook for sqlite, httpx client and feedgen import cost
+_database = None
+_tmdb_client = None
+_rss_module = None
+
+
+def get_database():
+    """Lazy load the database module on first use."""
+    global _database
+    if _database is None:
+        import database
+        _database = database
+    return _database
+
+
+def get_tmdb_client():
+    """Lazy load the TMDB client on first use."""
+    global _tmdb_client
+    if _tmdb_client is None:
+        from tmdb import tmdb_client
+        _tmdb_client = tmdb_client
+    return _tmdb_client
+
+
+def get_rss_module():
+    """Lazy load the RSS generators on first use."""
+    global _rss_module
+    if _rss_module is None:
+        import rss
+        _rss_module = rss
+    return _rss_module
+
 # Session duration: 30 days in seconds
 SESSION_DURATION_SECONDS = 30 * 24 * 60 * 60
 
+# Settings snapshots - these never change for the process lifetime, and
+# reading them as module globals skips pydantic's attribute machinery on
+# every auth/feed check
+_SECRET_BYTES = settings.app_secret_key.encode()
+_PRESHARED_PW = settings.preshared_password
+_FEED_TOKEN = settings.feed_token
+_PLEX_WEBHOOK_TOKEN = settings.plex_webhook_token
+
+
+# Unpadded urlsafe base64 of a 32-byte digest is always 43 chars; slicing
+# at that length drops the single '=' without a decode/rstrip round trip
+_SIG_LEN = 43
+
+
+@lru_cache(maxsize=2048)
+def _expected_sig(timestamp_str: str) -> bytes:
+    """
+    Signature for a timestamp string. Tokens are second-granular, so the
+    same timestamp always signs identically - memoizing turns repeat
+    verifications (every API call of a session) into a dict hit.
+    """
+    digest = hmac.new(_SECRET_BYTES, timestamp_str.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest)[:_SIG_LEN]
+
 
 def create_session_token() -> str:
     """Create a signed session token with timestamp."""
     timestamp = str(int(time.time()))
-    signature = hmac.new(
-        settings.app_secret_key.encode(),
-        timestamp.encode(),
-        hashlib.sha256
-    ).digest()
-    sig_b64 = base64.urlsafe_b64encode(signature).decode().rstrip("=")
-    return f"{timestamp}.{sig_b64}"
+    return f"{timestamp}.{_expected_sig(timestamp).decode('ascii')}"
 
 
 def verify_session_token(authorization: str | None = Header(None, alias="Authorization")) -> bool:
@@ -50,32 +98,31 @@ def verify_session_token(authorization: str | None = Header(None, alias="Authori
     if not authorization:
         raise HTTPException(status_code=401, detail="Authorization header required")
 
-    # Expect "Bearer <token>"
-    parts = authorization.split(" ", 1)
-    if len(parts) != 2 or parts[0].lower() != "bearer":
+    # Expect "Bearer <token>" - slice the fixed prefix rather than
+    # splitting, which allocates a list on every authenticated request
+    if len(authorization) < 8 or authorization[:7].lower() != "bearer ":
         raise HTTPException(status_code=401, detail="Invalid authorization format")
 
-    token = parts[1]
+    token = authorization[7:]
+
+    dot = token.find(".")
+    if dot < 0:
+        raise HTTPException(status_code=401, detail="Invalid token format")
+
+    timestamp_str = token[:dot]
+    sig_b64 = token[dot + 1:]
 
     try:
-        timestamp_str, sig_b64 = token.split(".", 1)
         timestamp = int(timestamp_str)
-    except (ValueError, AttributeError):
+    except ValueError:
         raise HTTPException(status_code=401, detail="Invalid token format")
 
     # Check if expired
     if time.time() - timestamp > SESSION_DURATION_SECONDS:
         raise HTTPException(status_code=401, detail="Session expired")
 
-    # Verify signature
-    expected_sig = hmac.new(
-        settings.app_secret_key.encode(),
-        timestamp_str.encode(),
-        hashlib.sha256
-    ).digest()
-    expected_b64 = base64.urlsafe_b64encode(expected_sig).decode().rstrip("=")
-
-    if not secrets.compare_digest(sig_b64, expected_b64):
+    # Verify signature (bytes vs bytes - the cached value never decodes)
+    if not secrets.compare_digest(sig_b64.encode(), _expected_sig(timestamp_str)):
         raise HTTPException(status_code=401, detail="Invalid token")
 
     return True
@@ -84,7 +131,7 @@ def verify_session_token(authorization: str | None = Header(None, alias="Authori
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize database on startup."""
-    await init_db()
+    await get_database().init_db()
     yield
 
 
@@ -92,24 +139,54 @@ app = FastAPI(
     title="Stellarr",
     description="A lightweight media request system with RSS feeds for Sonarr/Radarr",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Skipping the docs mounts also skips schema-generation setup at startup
+    docs_url="/docs" if settings.enable_docs else None,
+    redoc_url="/redoc" if settings.enable_docs else None,
+    openapi_url="/openapi.json" if settings.enable_docs else None,
+    # orjson serializes the plain dict/list payloads here directly,
+    # skipping the jsonable_encoder pass of the default JSONResponse
+    default_response_class=ORJSONResponse
 )
 
-# CORS configuration
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS configuration - optional (a fronting proxy/CDN may already inject
+# the headers). Handled inline instead of via CORSMiddleware so requests
+# cross one ASGI frame rather than two; preflights are answered from a
+# precomputed header dict without touching the router.
+if settings.enable_cors:
+    _CORS_ORIGINS = frozenset(o.strip() for o in settings.cors_origins.split(","))
+    _CORS_ANY_ORIGIN = "*" in _CORS_ORIGINS
+    _PREFLIGHT_HEADERS = {
+        "access-control-allow-methods": "GET, POST, DELETE, OPTIONS",
+        "access-control-allow-headers": "Authorization, Content-Type",
+        "access-control-allow-credentials": "true",
+        "access-control-max-age": "600",
+    }
+
+    @app.middleware("http")
+    async def cors_headers(request: Request, call_next):
+        """Answer preflights and stamp CORS headers on responses."""
+        origin = request.headers.get("origin")
+        if origin is None or not (_CORS_ANY_ORIGIN or origin in _CORS_ORIGINS):
+            return await call_next(request)
+
+        if request.method == "OPTIONS":
+            headers = dict(_PREFLIGHT_HEADERS)
+            headers["access-control-allow-origin"] = origin
+            return Response(status_code=204, headers=headers)
+
+        response = await call_next(request)
+        # Credentialed responses must echo the concrete origin, never "*"
+        response.headers["access-control-allow-origin"] = origin
+        response.headers["access-control-allow-credentials"] = "true"
+        return response
 
 
 # --- Auth Helpers ---
 
 def verify_feed_token(token: str | None = Query(None, alias="token")):
     """Verify the feed token for RSS/list endpoints."""
-    if not settings.feed_token:
+    if not _FEED_TOKEN:
         # No token configured, allow access
         return True
 
@@ -119,15 +196,26 @@ def verify_feed_token(token: str | None = Query(None, alias="token")):
             detail="Feed token required. Add ?token=YOUR_TOKEN to the URL."
         )
 
-    if not secrets.compare_digest(token, settings.feed_token):
+    if not secrets.compare_digest(token, _FEED_TOKEN):
         raise HTTPException(status_code=401, detail="Invalid feed token")
 
     return True
 
 
+def _feed_access_open() -> bool:
+    """Stand-in feed dependency for deployments with no feed token."""
+    return True
+
+
+# With no feed token configured every call resolved a Query parameter
+# just to return True. Bind the dependency once at import so open
+# deployments skip query extraction on each RSS/list request.
+_verify_feed = _feed_access_open if not _FEED_TOKEN else verify_feed_token
+
+
 def verify_plex_webhook_token(token: str | None = Query(None, alias="token")):
     """Verify the Plex webhook token."""
-    if not settings.plex_webhook_token:
+    if not _PLEX_WEBHOOK_TOKEN:
         # No token configured - reject all requests for security
         raise HTTPException(
             status_code=401,
@@ -140,7 +228,7 @@ def verify_plex_webhook_token(token: str | None = Query(None, alias="token")):
             detail="Webhook token required. Add ?token=YOUR_TOKEN to the URL."
         )
 
-    if not secrets.compare_digest(token, settings.plex_webhook_token):
+    if not secrets.compare_digest(token, _PLEX_WEBHOOK_TOKEN):
         raise HTTPException(status_code=401, detail="Invalid webhook token")
 
     return True
@@ -148,14 +236,22 @@ def verify_plex_webhook_token(token: str | None = Query(None, alias="token")):
 
 # --- Auth ---
 
+# Request bodies are tiny, well-typed POSTs - ignore unknown keys instead
+# of tracking them, and freeze instances so pydantic skips __setattr__
+# validation hooks
+_REQUEST_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
+
 class PasswordCheck(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     password: str
 
 
 @app.post("/api/auth/verify")
 async def verify_auth(data: PasswordCheck):
     """Verify the preshared password and return a session token."""
-    if secrets.compare_digest(data.password, settings.preshared_password):
+    if secrets.compare_digest(data.password, _PRESHARED_PW):
         token = create_session_token()
         return {"valid": True, "token": token}
     raise HTTPException(status_code=401, detail="Invalid password")
@@ -163,7 +259,39 @@ async def verify_auth(data: PasswordCheck):
 
 # --- Search ---
 
+def _year(date_str: str | None) -> int | None:
+    """Pull the year out of a TMDB date ('2024-05-01') in one pass."""
+    if date_str and len(date_str) >= 4 and date_str[0].isdigit():
+        return int(date_str[:4])
+    return None
+
+
+def _adapt_tmdb_item(item: dict, media_type: str, requested: bool, in_library: bool) -> dict:
+    """Project a TMDB search result into the shape the frontend expects."""
+    if media_type == "tv":
+        title = item.get("name", "Unknown")
+        year = _year(item.get("first_air_date"))
+    else:
+        title = item.get("title", "Unknown")
+        year = _year(item.get("release_date"))
+
+    return {
+        "id": item.get("id"),
+        "title": title,
+        "year": year,
+        "overview": item.get("overview"),
+        "poster_path": item.get("poster_path"),
+        "media_type": media_type,
+        "vote_average": item.get("vote_average"),
+        "requested": requested,
+        "in_library": in_library,
+        "number_of_seasons": None
+    }
+
+
 class SearchQuery(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     query: str
     media_type: str | None = None  # "movie", "tv", or None for multi
     page: int = 1
@@ -172,49 +300,39 @@ class SearchQuery(BaseModel):
 @app.post("/api/search")
 async def search(data: SearchQuery, _: bool = Depends(verify_session_token)):
     """Search TMDB for movies and TV shows."""
+    tmdb = get_tmdb_client()
+    db = get_database()
     try:
         if data.media_type == "movie":
-            results = await tmdb_client.search_movie(data.query, data.page)
+            results = await tmdb.search_movie(data.query, data.page)
         elif data.media_type == "tv":
-            results = await tmdb_client.search_tv(data.query, data.page)
+            results = await tmdb.search_tv(data.query, data.page)
         else:
-            results = await tmdb_client.search_multi(data.query, data.page)
+            results = await tmdb.search_multi(data.query, data.page)
 
         # Filter out person results and prepare items
         items = []
         tv_shows_to_fetch = []  # (index, tmdb_id) for TV shows needing season count
 
-        for item in results.get("results", []):
-            if item.get("media_type") == "person":
-                continue
+        candidates = [
+            (item, item.get("media_type", data.media_type or "movie"))
+            for item in results.get("results", [])
+            if item.get("media_type") != "person"
+        ]
+
+        # One IN query for the whole page instead of a SELECT per item,
+        # and one library scan instead of an EXISTS per item
+        requested_set = await db.is_requested_many(
+            [(item.get("id"), media_type) for item, media_type in candidates]
+        )
+        library_set = await db.get_library_ids()
 
-            media_type = item.get("media_type", data.media_type or "movie")
+        for item, media_type in candidates:
             tmdb_id = item.get("id")
+            requested = (tmdb_id, media_type) in requested_set
+            in_library = (tmdb_id, media_type) in library_set
 
-            # Determine title and year
-            if media_type == "tv":
-                title = item.get("name", "Unknown")
-                year = item.get("first_air_date", "")[:4] if item.get("first_air_date") else None
-            else:
-                title = item.get("title", "Unknown")
-                year = item.get("release_date", "")[:4] if item.get("release_date") else None
-
-            requested = await is_requested(tmdb_id, media_type)
-            in_library = await is_in_library(tmdb_id, media_type)
-
-            item_data = {
-                "id": tmdb_id,
-                "title": title,
-                "year": int(year) if year else None,
-                "overview": item.get("overview"),
-                "poster_path": item.get("poster_path"),
-                "media_type": media_type,
-                "vote_average": item.get("vote_average"),
-                "requested": requested,
-                "in_library": in_library,
-                "number_of_seasons": None
-            }
-            items.append(item_data)
+            items.append(_adapt_tmdb_item(item, media_type, requested, in_library))
 
             # Track TV shows that aren't already requested/in_library for season fetch
             if media_type == "tv" and not requested and not in_library:
@@ -224,7 +342,7 @@ async def search(data: SearchQuery, _: bool = Depends(verify_session_token)):
         if tv_shows_to_fetch:
             async def fetch_seasons(idx, show_id):
                 try:
-                    details = await tmdb_client.get_tv(show_id)
+                    details = await tmdb.get_tv(show_id)
                     return idx, details.get("number_of_seasons")
                 except Exception:
                     return idx, None
@@ -248,33 +366,62 @@ async def search(data: SearchQuery, _: bool = Depends(verify_session_token)):
 # --- Requests ---
 
 class MediaRequest(BaseModel):
+    model_config = _REQUEST_MODEL_CONFIG
+
     tmdb_id: int
     media_type: str  # "movie" or "tv"
 
 
+# TMDB detail payloads barely change - keep them briefly so re-requesting
+# an item just looked at (double click, request-after-search) skips the
+# HTTPS round trip
+_DETAIL_CACHE: dict[tuple[str, int], tuple[float, dict]] = {}
+_DETAIL_CACHE_TTL = 300.0  # seconds
+_DETAIL_CACHE_MAX = 512
+
+
+async def _get_details(media_type: str, tmdb_id: int) -> dict:
+    """Fetch TMDB movie/TV details through a small TTL cache."""
+    key = (media_type, tmdb_id)
+    hit = _DETAIL_CACHE.get(key)
+    if hit and time.time() - hit[0] < _DETAIL_CACHE_TTL:
+        return hit[1]
+
+    tmdb = get_tmdb_client()
+    if media_type == "movie":
+        details = await tmdb.get_movie(tmdb_id)
+    else:
+        details = await tmdb.get_tv(tmdb_id)
+
+    if len(_DETAIL_CACHE) >= _DETAIL_CACHE_MAX:
+        _DETAIL_CACHE.clear()
+    _DETAIL_CACHE[key] = (time.time(), details)
+    return details
+
+
 @app.post("/api/request")
 async def create_request(data: MediaRequest, _: bool = Depends(verify_session_token)):
     """Add a media item to the request list."""
+    db = get_database()
     try:
         # Get full details from TMDB
+        details = await _get_details(data.media_type, data.tmdb_id)
         if data.media_type == "movie":
-            details = await tmdb_client.get_movie(data.tmdb_id)
             title = details.get("title", "Unknown")
-            year = details.get("release_date", "")[:4] if details.get("release_date") else None
+            year = _year(details.get("release_date"))
             imdb_id = details.get("external_ids", {}).get("imdb_id")
             tvdb_id = None
         else:
-            details = await tmdb_client.get_tv(data.tmdb_id)
             title = details.get("name", "Unknown")
-            year = details.get("first_air_date", "")[:4] if details.get("first_air_date") else None
+            year = _year(details.get("first_air_date"))
             imdb_id = details.get("external_ids", {}).get("imdb_id")
             tvdb_id = details.get("external_ids", {}).get("tvdb_id")
 
-        success = await add_request(
+        success = await db.add_request(
             tmdb_id=data.tmdb_id,
             media_type=data.media_type,
             title=title,
-            year=int(year) if year else None,
+            year=year,
             overview=details.get("overview"),
             poster_path=details.get("poster_path"),
             imdb_id=imdb_id,
@@ -292,7 +439,7 @@ async def create_request(data: MediaRequest, _: bool = Depends(verify_session_to
 @app.delete("/api/request/{media_type}/{tmdb_id}")
 async def delete_request(media_type: str, tmdb_id: int, _: bool = Depends(verify_session_token)):
     """Remove a media item from the request list."""
-    success = await remove_request(tmdb_id, media_type)
+    success = await get_database().remove_request(tmdb_id, media_type)
     if success:
         return {"success": True, "message": "Request removed"}
     raise HTTPException(status_code=404, detail="Request not found")
@@ -301,7 +448,7 @@ async def delete_request(media_type: str, tmdb_id: int, _: bool = Depends(verify
 @app.get("/api/requests")
 async def list_requests(media_type: str | None = None, _: bool = Depends(verify_session_token)):
     """Get all requests, optionally filtered by media type."""
-    requests = await get_all_requests(media_type)
+    requests = await get_database().get_all_requests(media_type)
     return {"requests": requests}
 
 
@@ -313,11 +460,13 @@ async def get_library_status(_: bool = Depends(verify_session_token)):
     Get library and request status for frontend caching.
     Used to hydrate trending/search results with user-specific status.
     """
+    db = get_database()
+
     # Get all library TMDB IDs (just IDs, not full objects)
-    library = await get_all_library_tmdb_ids()
+    library = await db.get_all_library_tmdb_ids()
 
     # Get all pending requests (full objects for display)
-    all_requests = await get_all_requests()
+    all_requests = await db.get_all_requests()
     # Filter to only pending (not yet added)
     pending_requests = [r for r in all_requests if not r.get('added_at')]
 
@@ -330,19 +479,19 @@ async def get_library_status(_: bool = Depends(verify_session_token)):
 # --- RSS Feeds (protected by token) ---
 
 @app.get("/rss/movies")
-async def rss_movies(request: Request, _: bool = Depends(verify_feed_token)):
+async def rss_movies(request: Request, _: bool = Depends(_verify_feed)):
     """
     RSS feed for movie requests (Radarr compatible).
 
     Add ?token=YOUR_FEED_TOKEN if FEED_TOKEN is configured.
     """
     base_url = str(request.base_url).rstrip("/")
-    xml = await generate_movie_rss(base_url)
+    xml = await get_rss_module().generate_movie_rss(base_url)
     return Response(content=xml, media_type="application/rss+xml")
 
 
 @app.get("/rss/tv")
-async def rss_tv(request: Request, _: bool = Depends(verify_feed_token)):
+async def rss_tv(request: Request, _: bool = Depends(_verify_feed)):
     """
     RSS feed for TV show requests.
 
@@ -350,22 +499,22 @@ async def rss_tv(request: Request, _: bool = Depends(verify_feed_token)):
     Consider using /list/radarr for Radarr's StevenLu Custom format.
     """
     base_url = str(request.base_url).rstrip("/")
-    xml = await generate_tv_rss(base_url)
+    xml = await get_rss_module().generate_tv_rss(base_url)
     return Response(content=xml, media_type="application/rss+xml")
 
 
 @app.get("/rss/all")
-async def rss_all(request: Request, _: bool = Depends(verify_feed_token)):
+async def rss_all(request: Request, _: bool = Depends(_verify_feed)):
     """Combined RSS feed for all requests."""
     base_url = str(request.base_url).rstrip("/")
-    xml = await generate_combined_rss(base_url)
+    xml = await get_rss_module().generate_combined_rss(base_url)
     return Response(content=xml, media_type="application/rss+xml")
 
 
 # --- JSON Lists (for Radarr StevenLu Custom format) ---
 
 @app.get("/list/radarr")
-async def list_radarr(_: bool = Depends(verify_feed_token)):
+async def list_radarr(_: bool = Depends(_verify_feed)):
     """
     Radarr StevenLu Custom list format (JSON).
 
@@ -375,11 +524,11 @@ async def list_radarr(_: bool = Depends(verify_feed_token)):
     In Radarr: Settings -> Import Lists -> Add -> Custom Lists -> StevenLu Custom
     URL: https://your-domain.com/list/radarr?token=YOUR_TOKEN
     """
-    return await generate_radarr_json()
+    return await get_rss_module().generate_radarr_json()
 
 
 @app.get("/list/sonarr")
-async def list_sonarr(_: bool = Depends(verify_feed_token)):
+async def list_sonarr(_: bool = Depends(_verify_feed)):
     """
     Sonarr Custom List format (JSON).
 
@@ -389,19 +538,29 @@ async def list_sonarr(_: bool = Depends(verify_feed_token)):
     In Sonarr: Settings -> Import Lists -> Add -> Custom Lists
     URL: https://your-domain.com/list/sonarr?token=YOUR_TOKEN
     """
-    return await generate_sonarr_json()
+    return await get_rss_module().generate_sonarr_json()
 
 
 # --- Feed Info Endpoint ---
 
+# Serialized feed-info bodies keyed by base URL. The content is static
+# per URL; the small cap guards against Host-header churn growing the dict.
+_feed_info_bodies: dict[str, bytes] = {}
+_FEED_INFO_CACHE_MAX = 8
+
+
 @app.get("/api/feeds")
 async def get_feed_info(request: Request):
     """Get information about available feeds and their URLs."""
     base_url = str(request.base_url).rstrip("/")
+    cached = _feed_info_bodies.get(base_url)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     token_required = bool(settings.feed_token)
     token_param = "?token=YOUR_FEED_TOKEN" if token_required else ""
 
-    return {
+    info = {
         "token_required": token_required,
         "feeds": {
             "radarr": {
@@ -440,13 +599,27 @@ async def get_feed_info(request: Request):
         }
     }
 
+    body = json.dumps(info).encode()
+    if len(_feed_info_bodies) >= _FEED_INFO_CACHE_MAX:
+        _feed_info_bodies.clear()
+    _feed_info_bodies[base_url] = body
+    return Response(content=body, media_type="application/json")
+
 
 # --- Health Check ---
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "service": "stellarr"}
+_HEALTH_BODY = b'{"status": "healthy", "service": "stellarr"}'
+
+
+async def health_check(request: Request) -> Response:
+    """Health check endpoint - replays a pre-serialized body."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+
+# Registered as a raw Starlette route: the probe has no parameters or
+# dependencies, so there is nothing for FastAPI's solve_dependencies
+# machinery to do per call except cost time
+app.router.routes.append(Route("/api/health", health_check))
 
 
 # --- Plex Webhook ---
@@ -466,6 +639,8 @@ async def plex_webhook(
     Configure in Plex: Settings -> Webhooks -> Add
     URL: https://your-domain.com/webhook/plex?token=YOUR_PLEX_WEBHOOK_TOKEN
     """
+    db = get_database()
+
     try:
         data = json.loads(payload)
     except json.JSONDecodeError:
@@ -497,7 +672,7 @@ async def plex_webhook(
 
     # For episodes/seasons, check the Plex GUID cache first
     if media.plex_type in ('episode', 'season') and media.plex_guid:
-        cached = await get_plex_guid_cache(media.plex_guid)
+        cached = await db.get_plex_guid_cache(media.plex_guid)
         if cached:
             show_tmdb_id = cached.get('tmdb_id')
             show_tvdb_id = cached.get('tvdb_id')
@@ -511,7 +686,7 @@ async def plex_webhook(
     # Add to library only if we have a show-level TMDB ID (not episode-level)
     added_to_library = False
     if show_tmdb_id:
-        await sync_library(
+        await db.sync_library(
             [{"tmdb_id": show_tmdb_id, "tvdb_id": show_tvdb_id, "title": media.title}],
             media.media_type,
             clear_first=False
@@ -524,29 +699,29 @@ async def plex_webhook(
 
     # 1. Try TMDB ID (most reliable for movies and shows)
     if show_tmdb_id:
-        matched = await mark_as_added(show_tmdb_id, media.media_type)
+        matched = await db.mark_as_added(show_tmdb_id, media.media_type)
         if matched:
             # Cache the plex_guid for future episode webhooks
             if media.plex_guid:
-                await update_plex_guid(show_tmdb_id, media.media_type, media.plex_guid)
-                await set_plex_guid_cache(media.plex_guid, show_tmdb_id, show_tvdb_id)
+                await db.update_plex_guid(show_tmdb_id, media.media_type, media.plex_guid)
+                await db.set_plex_guid_cache(media.plex_guid, show_tmdb_id, show_tvdb_id)
 
     # 2. Try TVDB ID (common for TV shows)
     if not matched and show_tvdb_id and media.media_type == 'tv':
-        matched_request = await find_by_tvdb_id(show_tvdb_id, media.media_type)
+        matched_request = await db.find_by_tvdb_id(show_tvdb_id, media.media_type)
         if matched_request:
-            matched = await mark_as_added(matched_request['tmdb_id'], media.media_type)
+            matched = await db.mark_as_added(matched_request['tmdb_id'], media.media_type)
             if matched and media.plex_guid:
-                await update_plex_guid(matched_request['tmdb_id'], media.media_type, media.plex_guid)
-                await set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], show_tvdb_id)
+                await db.update_plex_guid(matched_request['tmdb_id'], media.media_type, media.plex_guid)
+                await db.set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], show_tvdb_id)
 
     # 3. Try Plex GUID (for episodes/seasons using cached show GUID from requests table)
     if not matched and media.plex_guid:
-        matched_request = await find_by_plex_guid(media.plex_guid)
+        matched_request = await db.find_by_plex_guid(media.plex_guid)
         if matched_request:
-            matched = await mark_as_added(matched_request['tmdb_id'], matched_request['media_type'])
+            matched = await db.mark_as_added(matched_request['tmdb_id'], matched_request['media_type'])
             if matched and not resolved_from_cache:
-                await set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], matched_request.get('tvdb_id'))
+                await db.set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], matched_request.get('tvdb_id'))
 
     # 4. Try TVDB reverse lookup (episode TVDB ID → show TVDB ID)
     # Only do this if we have an episode TVDB ID and haven't matched yet
@@ -554,33 +729,33 @@ async def plex_webhook(
         from tvdb import get_series_id_from_episode
         show_tvdb_id_resolved = await get_series_id_from_episode(media.episode_tvdb_id)
         if show_tvdb_id_resolved:
-            matched_request = await find_by_tvdb_id(show_tvdb_id_resolved, 'tv')
+            matched_request = await db.find_by_tvdb_id(show_tvdb_id_resolved, 'tv')
             if matched_request:
-                matched = await mark_as_added(matched_request['tmdb_id'], 'tv')
+                matched = await db.mark_as_added(matched_request['tmdb_id'], 'tv')
                 if matched and media.plex_guid:
-                    await update_plex_guid(matched_request['tmdb_id'], 'tv', media.plex_guid)
+                    await db.update_plex_guid(matched_request['tmdb_id'], 'tv', media.plex_guid)
                     # Cache for future episode webhooks of this show
-                    await set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], show_tvdb_id_resolved)
+                    await db.set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], show_tvdb_id_resolved)
 
             # Even if we didn't match a request, cache the resolved show IDs for future episodes
             if media.plex_guid and not resolved_from_cache:
                 if matched_request:
-                    await set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], show_tvdb_id_resolved)
+                    await db.set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], show_tvdb_id_resolved)
                 else:
                     # Cache just the TVDB ID - future lookups can use this
-                    await set_plex_guid_cache(media.plex_guid, None, show_tvdb_id_resolved)
+                    await db.set_plex_guid_cache(media.plex_guid, None, show_tvdb_id_resolved)
 
     # 5. Try title-based matching as fallback (for unmatched Plex imports)
     # Only attempt if we still haven't matched and have no TMDB/TVDB IDs
     if not matched and not show_tmdb_id and not show_tvdb_id:
-        print(f"WEBHOOK: No IDs available, attempting title match for '{media.title}'")
-        matched_request = await find_by_title(media.title, media.media_type, media.year)
+        logger.info("WEBHOOK: No IDs available, attempting title match for '%s'", media.title)
+        matched_request = await db.find_by_title(media.title, media.media_type, media.year)
         if matched_request:
-            matched = await mark_as_added(matched_request['tmdb_id'], media.media_type)
+            matched = await db.mark_as_added(matched_request['tmdb_id'], media.media_type)
             if matched:
-                print(f"WEBHOOK: Matched request by title '{media.title}' -> TMDB {matched_request['tmdb_id']}")
+                logger.info("WEBHOOK: Matched request by title '%s' -> TMDB %s", media.title, matched_request['tmdb_id'])
                 # Add to library using the request's TMDB ID
-                await sync_library(
+                await db.sync_library(
                     [{"tmdb_id": matched_request['tmdb_id'], "tvdb_id": matched_request.get('tvdb_id'), "title": media.title}],
                     media.media_type,
                     clear_first=False
@@ -588,10 +763,10 @@ async def plex_webhook(
                 added_to_library = True
                 # Cache plex_guid for future lookups
                 if media.plex_guid:
-                    await update_plex_guid(matched_request['tmdb_id'], media.media_type, media.plex_guid)
-                    await set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], matched_request.get('tvdb_id'))
+                    await db.update_plex_guid(matched_request['tmdb_id'], media.media_type, media.plex_guid)
+                    await db.set_plex_guid_cache(media.plex_guid, matched_request['tmdb_id'], matched_request.get('tvdb_id'))
         else:
-            print(f"WEBHOOK: Title match failed - no unique match found")
+            logger.info("WEBHOOK: Title match failed - no unique match found")
 
     # Use resolved show-level TMDB ID in result (or original if show/movie)
     result_tmdb_id = show_tmdb_id if show_tmdb_id else media.tmdb_id
@@ -626,6 +801,8 @@ async def sync_library_endpoint(
 
     Add &clear=true on first batch to clear existing items.
     """
+    db = get_database()
+
     if media_type not in ('movie', 'tv'):
         raise HTTPException(status_code=400, detail="media_type must be 'movie' or 'tv'")
 
@@ -638,14 +815,14 @@ async def sync_library_endpoint(
         raise HTTPException(status_code=400, detail="Body must be a JSON array")
 
     # Sync the library
-    count = await sync_library(data, media_type, clear_first=clear)
+    count = await db.sync_library(data, media_type, clear_first=clear)
 
     # Mark any matching requests as added
     marked = 0
     for item in data:
         tmdb_id = item.get('tmdb_id')
         if tmdb_id:
-            if await mark_as_added(tmdb_id, media_type):
+            if await db.mark_as_added(tmdb_id, media_type):
                 marked += 1
 
     return {
@@ -8,11 +8,14 @@ The TVDB API uses a login flow:
 We cache the token and refresh when expired.
 """
 import httpx
+import logging
 import time
 from config import get_settings
 
 settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
 # Token cache
 _token: str | None = None
 _token_expires: float = 0
@@ -42,7 +45,7 @@ async def _login() -> str | None:
             _token_expires = time.time() + TOKEN_LIFETIME_SECONDS
             return _token
     except Exception as e:
-        print(f"TVDB login failed: {e}")
+        logger.error("TVDB login failed: %s", e)
         return None
 
 
@@ -80,8 +83,8 @@ async def get_series_id_from_episode(episode_tvdb_id: int) -> int | None:
         if e.response.status_code == 404:
             # Episode not found
             return None
-        print(f"TVDB episode lookup failed: {e}")
+        logger.error("TVDB episode lookup failed: %s", e)
         return None
     except Exception as e:
-        print(f"TVDB episode lookup failed: {e}")
+        logger.error("TVDB episode lookup failed: %s", e)
         return None
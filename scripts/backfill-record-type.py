@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Backfill record_type='request' onto pre-existing request rows.
+
+The record_type-created_at GSI (terraform/dynamodb.tf) only indexes rows
+that carry record_type. Requests written before the index existed don't,
+so they are invisible to the GSI read path. This script stamps every
+movie/tv row that is missing the attribute; run it once per deployment,
+verify the listing, then set USE_RECORD_TYPE_INDEX=true on the Lambda.
+
+Uses the backend's lightweight DynamoDB client - no boto3 needed, just
+AWS credentials in the environment (AWS_ACCESS_KEY_ID / profile / role).
+
+Usage:
+    python backfill-record-type.py --table stellarr-requests --region us-east-1
+
+    # Preview what would be stamped without writing
+    python backfill-record-type.py --table stellarr-requests --dry-run
+
+Or via environment variables:
+    export DYNAMODB_TABLE=stellarr-requests
+    export AWS_REGION_NAME=us-east-1
+    python backfill-record-type.py
+"""
+import argparse
+import os
+import sys
+
+# The DynamoDB client lives in the Lambda backend - reuse it rather than
+# pulling in boto3 just for this one-shot job
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend-lambda'))
+
+from dynamodb_lite import DynamoDBClient, ConditionalCheckFailedException  # noqa: E402
+
+# Partitions that hold request items - keep in step with
+# backend-lambda/database.py KNOWN_MEDIA_TYPES
+MEDIA_TYPES = ('movie', 'tv')
+
+
+def find_missing(client: DynamoDBClient, segments: int) -> list[dict]:
+    """Scan for movie/tv rows that don't carry record_type yet."""
+    return client.scan(
+        filter_expression=(
+            'attribute_not_exists(record_type) AND media_type IN (:movie, :tv)'
+        ),
+        expression_attribute_values={
+            ':movie': MEDIA_TYPES[0],
+            ':tv': MEDIA_TYPES[1],
+        },
+        projection_expression='media_type, tmdb_id, title',
+        total_segments=segments,
+    )
+
+
+def stamp(client: DynamoDBClient, rows: list[dict], dry_run: bool) -> int:
+    """Set record_type='request' on each row. Returns the count stamped."""
+    stamped = 0
+    for row in rows:
+        label = f"{row['media_type']}/{row['tmdb_id']} ({row.get('title', '?')})"
+        if dry_run:
+            print(f"  would stamp {label}")
+            stamped += 1
+            continue
+        try:
+            client.update_item(
+                key={
+                    'media_type': row['media_type'],
+                    'tmdb_id': row['tmdb_id'],
+                },
+                update_expression='SET record_type = :rt',
+                # Never resurrect a row deleted between scan and update
+                condition_expression='attribute_exists(media_type)',
+                expression_attribute_values={':rt': 'request'},
+            )
+            stamped += 1
+        except ConditionalCheckFailedException:
+            print(f"  skipped {label} - deleted since scan")
+        except Exception as e:
+            print(f"  error stamping {label}: {e}")
+    return stamped
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Backfill record_type='request' for the request-listing GSI"
+    )
+    parser.add_argument(
+        '--table',
+        default=os.environ.get('DYNAMODB_TABLE', 'stellarr-requests'),
+        help='DynamoDB table name (default: $DYNAMODB_TABLE or stellarr-requests)'
+    )
+    parser.add_argument(
+        '--region',
+        default=os.environ.get('AWS_REGION_NAME', 'us-east-1'),
+        help='AWS region (default: $AWS_REGION_NAME or us-east-1)'
+    )
+    parser.add_argument(
+        '--segments',
+        type=int,
+        default=4,
+        help='Parallel scan segments (default: 4)'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='List rows that would be stamped without writing'
+    )
+    args = parser.parse_args()
+
+    client = DynamoDBClient(args.table, args.region)
+
+    print(f"Scanning {args.table} ({args.region}) for rows missing record_type...")
+    rows = find_missing(client, args.segments)
+    if not rows:
+        print("Nothing to backfill - safe to set USE_RECORD_TYPE_INDEX=true.")
+        return
+
+    print(f"Found {len(rows)} row(s) to stamp")
+    stamped = stamp(client, rows, args.dry_run)
+
+    if args.dry_run:
+        print(f"Dry run: {stamped} row(s) would be stamped")
+    else:
+        print(f"Stamped {stamped}/{len(rows)} row(s)")
+        if stamped == len(rows):
+            print("Backfill complete - safe to set USE_RECORD_TYPE_INDEX=true.")
+
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,41 @@ resource "aws_dynamodb_table" "requests" {
     type = "N"
   }
 
+  attribute {
+    name = "plex_guid"
+    type = "S"
+  }
+
+  attribute {
+    name = "record_type"
+    type = "S"
+  }
+
+  attribute {
+    name = "created_at"
+    type = "S"
+  }
+
+  # Sparse index for the Plex webhook lookup - only items that carry a
+  # plex_guid are indexed, turning a full-table Scan into a Query.
+  # tvdb_id is projected because the webhook handler reads it on a match.
+  global_secondary_index {
+    name               = "plex_guid-index"
+    hash_key           = "plex_guid"
+    projection_type    = "INCLUDE"
+    non_key_attributes = ["tvdb_id"]
+  }
+
+  # Request listing - every request row carries record_type = "request",
+  # so the combined list is a Query sorted by created_at instead of a
+  # full-table Scan filtered and sorted in Python.
+  global_secondary_index {
+    name            = "record_type-created_at-index"
+    hash_key        = "record_type"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
   # TTL for automatic cleanup of rate limit entries
   ttl {
     attribute_name = "ttl"
@@ -172,6 +172,7 @@ resource "aws_lambda_function" "api" {
       RATE_LIMIT_ENABLED        = var.enable_rate_limiting ? "true" : "false"
       RATE_LIMIT_MAX_ATTEMPTS   = tostring(var.rate_limit_max_attempts)
       RATE_LIMIT_WINDOW_SECONDS = tostring(var.rate_limit_window_seconds)
+      USE_RECORD_TYPE_INDEX     = var.use_record_type_index ? "true" : "false"
       VAPID_PUBLIC_KEY          = terraform_data.vapid_keys.output.public_key
     }
   }
@@ -118,6 +118,12 @@ variable "rate_limit_window_seconds" {
   default     = 900  # 15 minutes
 }
 
+variable "use_record_type_index" {
+  description = "Serve request listings from the record_type GSI. Enable only after scripts/backfill-record-type.py has stamped pre-existing rows, or they drop from listings."
+  type        = bool
+  default     = false
+}
+
 variable "app_name" {
   description = "Application name displayed in the header"
   type        = string